@@ -19,12 +19,13 @@ References:
     Comision Reguladora de Energia. https://www.gob.mx/cms/uploads/attachment/file/981194/aviso_fesen_2024.pdf
 """
 
-import json
 import csv
 import os
 import argparse
 from datetime import datetime, timedelta
 
+from src.json_utils import fast_json_dump, fast_json_load
+
 # ── Constants ─────────────────────────────────────────────────────────────────
 
 # Mexico national grid emission factor (kg CO2e per kWh)
@@ -39,8 +40,7 @@ SCENARIO_LABELS = {
 # ── Utility Functions ─────────────────────────────────────────────────────────
 
 def read_json(path):
-    with open(path, 'r') as f:
-        return json.load(f)
+    return fast_json_load(path)
 
 def read_csv(path):
     with open(path, 'r') as f:
@@ -51,8 +51,7 @@ def write_json(data, path):
     dir_name = os.path.dirname(path)
     if dir_name:
         os.makedirs(dir_name, exist_ok=True)
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    fast_json_dump(data, path)
     print(f"  + {path}")
 
 def get_house_dirs(scenario_dir):
@@ -6,6 +6,7 @@ Configure parameters in config.json before running.
 
 Usage:
     python3 main.py
+    python3 main.py --config config.json --yes   # Non-interactive (batch runs)
 
 Author: Team 3 - GreenGrid Project
 Course: COM 139 - Simulation & Visualization
@@ -18,109 +19,136 @@ Update:
 from src.Simulation import Simulation
 from src.DataLogger import DataLogger
 from src.HouseholdSimulation import HouseholdSimulation
+from src.json_utils import fast_json_load
+import argparse
 import sys
 import os
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 def print_header():
     """Print welcome header."""
-    print("\n" + "=" * 70)
-    print("   ___                  ___     _     _   ___ _          ")
-    print("  / __|_ _ ___ ___ _ _ / __|_ _(_)__| | / __(_)_ __     ")
-    print(" | (_ | '_/ -_) -_) ' \ (_ | '_| / _` | \__ \ | '  \    ")
-    print("  \___|_| \___\___|_||_\___|_| |_\__,_| |___/_|_|_|_|   ")
-    print("")
-    print("          Digital Twin Simulation - Phase 1")
-    print("=" * 70)
-    print("\nTeam 3 - COM 139: Simulation & Visualization")
-    print("Universidad Panamericana, Guadalajara")
-    print("-" * 70)
+    sys.stdout.write("\n".join([
+        "\n" + "=" * 70,
+        "   ___                  ___     _     _   ___ _          ",
+        "  / __|_ _ ___ ___ _ _ / __|_ _(_)__| | / __(_)_ __     ",
+        " | (_ | '_/ -_) -_) ' \\ (_ | '_| / _` | \\__ \\ | '  \\    ",
+        "  \\___|_| \\___\\___|_||_\\___|_| |_\\__,_| |___/_|_|_|_|   ",
+        "",
+        "          Digital Twin Simulation - Phase 1",
+        "=" * 70,
+        "\nTeam 3 - COM 139: Simulation & Visualization",
+        "Universidad Panamericana, Guadalajara",
+        "-" * 70,
+    ]) + "\n")
 
-def print_configuration_info(config):
-    """Print simulation configuration summary."""
-    print("\n SIMULATION CONFIGURATION:")
-    print(f"  Duration: {config['simulation']['duration_days']} days")
-    print(f"  Season: {config['simulation']['season']}")
-    print(f"  Strategy: {config['energy_management']['strategy']}")
-    print(f"  Start Date: {config['simulation']['start_date']}")
-    print(f"  Time Step: {config['simulation']['time_step_minutes']} minutes")
-    
-    print(f"\n⚡ SYSTEM:")
-    battery_count = config['battery'].get('count', 1)
-    battery_unit = config['battery']['unit_capacity_kwh']
-    print(f"  Battery: {battery_count} × {battery_unit} kWh = {battery_count * battery_unit} kWh")
-    
-    solar_count = config['solar'].get('count', 1)
-    solar_unit = config['solar']['unit_peak_power_kw']
-    print(f"  Solar: {solar_count} × {solar_unit} kW = {solar_count * solar_unit} kW peak")
-    
-    inverter_count = config['inverter'].get('count', 1)
-    inverter_unit = config['inverter']['unit_max_output_kw']
-    print(f"  Inverter: {inverter_count} × {inverter_unit} kW = {inverter_count * inverter_unit} kW max")
+def print_configuration_info(cfg):
+    """Print simulation configuration summary from a SimConfig."""
+    # Built as one block and written with a single call
+    sys.stdout.write("\n".join([
+        "\n SIMULATION CONFIGURATION:",
+        f"  Duration: {cfg.duration_days} days",
+        f"  Season: {cfg.season}",
+        f"  Strategy: {cfg.strategy}",
+        f"  Start Date: {cfg.start_date}",
+        f"  Time Step: {cfg.time_step_minutes} minutes",
+        f"\n⚡ SYSTEM:",
+        f"  Battery: {cfg.battery_count} × {cfg.battery_unit_kwh} kWh = {cfg.battery_capacity_kwh} kWh",
+        f"  Solar: {cfg.solar_count} × {cfg.solar_unit_kw} kW = {cfg.solar_peak_kw} kW peak",
+        f"  Inverter: {cfg.inverter_count} × {cfg.inverter_unit_kw} kW = {cfg.inverter_max_kw} kW max",
+    ]) + "\n")
 
 def print_results_summary(results):
     """Print key results summary."""
-    print("\n" + "=" * 70)
-    print(" SIMULATION RESULTS SUMMARY")
-    print("=" * 70)
+    summary = results['summary']
+    financial = results['financial']
+    battery = results['battery']
+    reliability = results['reliability']
     
-    print("\n Energy:")
-    print(f"  Solar Generated: {results['summary']['total_solar_generated_kwh']:.2f} kWh")
-    print(f"  Load Consumed: {results['summary']['total_load_consumed_kwh']:.2f} kWh")
-    print(f"  Grid Imported: {results['summary']['total_grid_imported_kwh']:.2f} kWh")
-    print(f"  Grid Exported: {results['summary']['total_grid_exported_kwh']:.2f} kWh")
-    print(f"  Curtailed: {results['summary']['total_curtailed_kwh']:.2f} kWh")
-    
-    print("\n Financial:")
-    print(f"  Import Cost: ${results['financial']['total_import_cost']:.2f}")
-    print(f"  Export Revenue: ${results['financial']['total_export_revenue']:.2f}")
-    print(f"  Net Cost: ${results['financial']['net_cost']:.2f}")
-    
-    print("\n Battery:")
-    print(f"  Average SoC: {results['battery']['average_soc_percent']:.2f}%")
-    print(f"  Final SoC: {results['battery']['final_soc_percent']:.2f}%")
+    # Built as one block and written with a single call
+    sys.stdout.write("\n".join([
+        "\n" + "=" * 70,
+        " SIMULATION RESULTS SUMMARY",
+        "=" * 70,
+        "\n Energy:",
+        f"  Solar Generated: {summary['total_solar_generated_kwh']:.2f} kWh",
+        f"  Load Consumed: {summary['total_load_consumed_kwh']:.2f} kWh",
+        f"  Grid Imported: {summary['total_grid_imported_kwh']:.2f} kWh",
+        f"  Grid Exported: {summary['total_grid_exported_kwh']:.2f} kWh",
+        f"  Curtailed: {summary['total_curtailed_kwh']:.2f} kWh",
+        "\n Financial:",
+        f"  Import Cost: ${financial['total_import_cost']:.2f}",
+        f"  Export Revenue: ${financial['total_export_revenue']:.2f}",
+        f"  Net Cost: ${financial['net_cost']:.2f}",
+        "\n Battery:",
+        f"  Average SoC: {battery['average_soc_percent']:.2f}%",
+        f"  Final SoC: {battery['final_soc_percent']:.2f}%",
+        "\n Performance:",
+        f"  Self-Sufficiency: {summary['self_sufficiency_percent']:.2f}%",
+        f"  Inverter Failures: {reliability['inverter_failures']}",
+        f"  Unmet Load: {reliability['unmet_load_percentage']:.2f}%",
+    ]) + "\n")
+
+def select_config():
+    """
+    Ask which mode and configuration file to run.
     
-    print("\n Performance:")
-    print(f"  Self-Sufficiency: {results['summary']['self_sufficiency_percent']:.2f}%")
-    print(f"  Inverter Failures: {results['reliability']['inverter_failures']}")
-    print(f"  Unmet Load: {results['reliability']['unmet_load_percentage']:.2f}%")
+    Returns:
+        tuple: (config path, True if it is a neighborhood config)
+    """
+    print("\n" + "-" * 70)
+    print("\n SELECT MODE:")
+    print("  1. Single household (config.json)")
+    print("  2. Neighborhood     (neighborhood_config.json)")
+    print("-" * 70)
+    mode = input("▶ Enter 1 or 2 (or Ctrl+C to cancel): ").strip()
+
+    if mode == '2':
+        print("\n SELECT CONFIG:")
+        print("  1. Standard     (neighborhood_config.json)")
+        print("  2. ML Realistic (neighborhood_config_ml.json)")
+        print("-" * 70)
+        cfg_mode = input("▶ Enter 1 or 2: ").strip()
+        cfg_file = "neighborhood_config_ml.json" if cfg_mode == "2" else "neighborhood_config.json"
+        return os.path.join(BASE_DIR, cfg_file), True
+
+    print("\n SELECT CONFIG:")
+    print("  1. Standard     (config.json)")
+    print("  2. ML Realistic (config_ml.json)")
+    print("-" * 70)
+    cfg_mode = input("▶ Enter 1 or 2: ").strip()
+    cfg_file = "config_ml.json" if cfg_mode == "2" else "config.json"
+    return os.path.join(BASE_DIR, cfg_file), False
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="GreenGrid digital twin simulation")
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help="Start without waiting for ENTER (for scripted/batch runs)")
+    parser.add_argument('--config',
+                        help="Household or neighborhood config to run, skipping the selection menu")
+    args = parser.parse_args()
+    
     try:
         # Print header
         print_header()
         
-        # Confirm before running
-        print("\n" + "-" * 70)
-        print("\n SELECT MODE:")
-        print("  1. Single household (config.json)")
-        print("  2. Neighborhood     (neighborhood_config.json)")
-        print("-" * 70)
-        mode = input("▶ Enter 1 or 2 (or Ctrl+C to cancel): ").strip()
+        # Choose what to run (neighborhood configs have a 'neighborhood' section)
+        if args.config:
+            config_path = args.config
+            is_neighborhood = 'neighborhood' in fast_json_load(config_path)
+        else:
+            config_path, is_neighborhood = select_config()
 
-        if mode == '2':
-            print("\n SELECT CONFIG:")
-            print("  1. Standard     (neighborhood_config.json)")
-            print("  2. ML Realistic (neighborhood_config_ml.json)")
-            print("-" * 70)
-            cfg_mode = input("▶ Enter 1 or 2: ").strip()
-            cfg_file = "neighborhood_config_ml.json" if cfg_mode == "2" else "neighborhood_config.json"
-            neighborhood = HouseholdSimulation(
-                config_path=os.path.join(BASE_DIR, cfg_file)
-            )
-            input("▶ Press ENTER to start neighborhood simulation: ")
+        if is_neighborhood:
+            neighborhood = HouseholdSimulation(config_path=config_path)
+            if not args.yes:
+                input("▶ Press ENTER to start neighborhood simulation: ")
             neighborhood.run()
         else:
-            print("\n SELECT CONFIG:")
-            print("  1. Standard     (config.json)")
-            print("  2. ML Realistic (config_ml.json)")
-            print("-" * 70)
-            cfg_mode = input("▶ Enter 1 or 2: ").strip()
-            cfg_file = "config_ml.json" if cfg_mode == "2" else "config.json"
-            sim = Simulation(config_path=os.path.join(BASE_DIR, cfg_file))
-            print_configuration_info(sim.config)
-            input("▶ Press ENTER to start simulation: ")
+            sim = Simulation(config_path=config_path)
+            print_configuration_info(sim.sim_config)
+            if not args.yes:
+                input("▶ Press ENTER to start simulation: ")
             results = sim.run()
             print_results_summary(results)
             logger = DataLogger(results, sim.config, output_dir=os.path.join(BASE_DIR, 'results'))
@@ -1,4 +1,27 @@
 import math
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _battery_constants(capacity_kwh, efficiency, min_soc):
+    """
+    Derived constants of a battery configuration, memoized across batteries.
+    
+    A run builds several batteries from the same few configurations, so
+    each combination is only worked out once.
+    
+    Returns:
+        tuple: (min energy kWh, is_full() threshold energy kWh,
+                one-way efficiency, reciprocal of the one-way efficiency)
+    """
+    one_way_efficiency = math.sqrt(efficiency)
+    # efficiency > 0, so the reciprocal is safe; multiplying by it
+    # replaces a division on every charge/discharge step
+    return (capacity_kwh * min_soc,
+            capacity_kwh * 0.999,  # is_full() default threshold (99.9%)
+            one_way_efficiency,
+            1.0 / one_way_efficiency)
+
 
 class Battery:
     """
@@ -10,6 +33,12 @@ class Battery:
     - Rejected energy is ONLY due to capacity limits (not efficiency)
     """
     
+    # Fixed attribute layout: faster attribute access on the per-step
+    # methods and a smaller footprint per battery
+    __slots__ = ('_capacity_kwh', '_efficiency', '_min_soc', '_energy_kwh',
+                 '_min_energy_kwh', '_full_energy_kwh', '_one_way_efficiency',
+                 '_inv_one_way_efficiency')
+    
     def __init__(self, capacity_kwh, efficiency, min_soc):
         """
         Initialize the battery with given parameters.
@@ -23,8 +52,9 @@ class Battery:
         self._efficiency = efficiency
         self._min_soc = min_soc
         self._energy_kwh = capacity_kwh * 0.5  # Start at 50% SoC
-        self._min_energy_kwh = capacity_kwh * min_soc
-        self._one_way_efficiency = math.sqrt(efficiency)  # One-way efficiency
+        (self._min_energy_kwh, self._full_energy_kwh,
+         self._one_way_efficiency, self._inv_one_way_efficiency) = _battery_constants(
+            capacity_kwh, efficiency, min_soc)
 
     def get_soc(self) -> float:
         """
@@ -35,6 +65,15 @@ class Battery:
         """
         return (self._energy_kwh / self._capacity_kwh) * 100
     
+    def soc_fraction(self) -> float:
+        """
+        Get the current State of Charge (SoC) as a fraction of capacity.
+
+        Returns:
+            float: Current SoC (0-1)
+        """
+        return self._energy_kwh / self._capacity_kwh
+    
     def is_full(self, threshold=99.9) -> bool:
         """
         Check if battery is effectively full.
@@ -45,7 +84,10 @@ class Battery:
         Returns:
             bool: True if SoC >= threshold
         """
-        return self.get_soc() >= threshold
+        # Compare stored energy directly instead of converting to a percentage
+        if threshold == 99.9:
+            return self._energy_kwh >= self._full_energy_kwh
+        return self._energy_kwh >= self._capacity_kwh * threshold * 0.01
     
     def is_empty(self) -> bool:
         """
@@ -80,6 +122,10 @@ class Battery:
             >>> # Returns consumed: 9.487 kWh (what it took from source)
             >>> # Efficiency loss: 10 - 9.487 = 0.513 kWh (lost as heat)
         """
+        # Same arithmetic as _charge_step() in EnergyManagementSystem,
+        # written out here because a per-call dispatch into the kernel
+        # costs more than the math itself. The two must change together
+        
         # Step 1: Calculate how much energy can be stored after efficiency
         usable_energy = energy_kwh * self._one_way_efficiency
         
@@ -88,11 +134,11 @@ class Battery:
         
         # Step 3: Calculate actual energy that will be stored
         # (limited by available space)
-        energy_to_store = min(usable_energy, space_available)
+        energy_to_store = usable_energy if usable_energy < space_available else space_available
         
         # Step 4: Calculate how much energy was CONSUMED from source
         # This is the inverse operation: stored / efficiency
-        energy_consumed_from_source = energy_to_store / self._one_way_efficiency
+        energy_consumed_from_source = energy_to_store * self._inv_one_way_efficiency
         
         # Step 5: Update battery state
         self._energy_kwh += energy_to_store
@@ -126,15 +172,23 @@ class Battery:
             >>> # Delivers: 5.0 kWh to load
             >>> # Efficiency loss: 0.27 kWh (lost as heat)
         """
+        # Same arithmetic as _discharge_step() in EnergyManagementSystem,
+        # written out here because a per-call dispatch into the kernel
+        # costs more than the math itself. The two must change together
+
         # Step 1: Calculate energy needed from battery accounting for efficiency
         # To deliver X kWh, we need to extract X/η kWh from battery
-        required_energy = energy_kwh / self._one_way_efficiency
+        required_energy = energy_kwh * self._inv_one_way_efficiency
 
         # Step 2: Calculate maximum available energy (respecting min_soc)
         max_available = self._energy_kwh - self._min_energy_kwh
+        # Rounding can leave the battery a hair under min_soc (is_empty()):
+        # nothing can be extracted then
+        if max_available < 0.0:
+            max_available = 0.0
 
         # Step 3: Calculate actual energy that can be extracted
-        actual_extracted = min(required_energy, max_available)
+        actual_extracted = required_energy if required_energy < max_available else max_available
 
         # Step 4: Update battery energy
         self._energy_kwh -= actual_extracted
@@ -144,6 +198,10 @@ class Battery:
 
         return supplied
     
+    def get_one_way_efficiency(self) -> float:
+        """Get one-way (charge or discharge) efficiency, sqrt of round-trip."""
+        return self._one_way_efficiency
+    
     def get_capacity(self) -> float:
         """Get total battery capacity in kWh."""
         return self._capacity_kwh
@@ -1,4 +1,4 @@
-import random
+import numpy as np
 
 class CloudCoverage:
     """
@@ -7,46 +7,88 @@ class CloudCoverage:
     
     # Seasonal probabilities: [Clear, Partly Cloudy, Mostly Cloudy, Overcast]
     PROBABILITIES = {
-        'spring': [0.1, 0.3, 0.4, 0.2],
-        'summer': [0.05, 0.15, 0.3, 0.5],
-        'fall': [0.2, 0.4, 0.3, 0.1],
-        'winter': [0.3, 0.4, 0.2, 0.1]
+        'spring': (0.1, 0.3, 0.4, 0.2),
+        'summer': (0.05, 0.15, 0.3, 0.5),
+        'fall': (0.2, 0.4, 0.3, 0.1),
+        'winter': (0.3, 0.4, 0.2, 0.1)
     }
     
     # Cloud coverage ranges for each level
-    COVERAGE_RANGES = [
+    COVERAGE_RANGES = (
         (0.0, 0.2),   # Clear
         (0.2, 0.6),   # Partly Cloudy
         (0.6, 0.8),   # Mostly Cloudy
         (0.8, 0.9)    # Overcast
-    ]
+    )
     
-    def __init__(self, season='summer'):
+    # Days of coverage generated per refill of the internal buffer
+    BATCH_DAYS = 366
+    
+    __slots__ = ('_season', '_cum', '_mins', '_maxs', '_rng', '_buffer', '_next')
+    
+    def __init__(self, season='summer', seed=None, rng=None):
         """
         Initialize cloud coverage simulator.
         
         Args:
             season (str): Season name ('spring', 'summer', 'fall', 'winter')
+            seed (int): Seed for this simulator's random generator
+                        (None = unpredictable, not reproducible)
+            rng (np.random.Generator): Generator to draw from instead, e.g. one
+                shared with the other stochastic components (overrides seed)
         """
         if season not in self.PROBABILITIES:
             raise ValueError(f"Invalid season: {season}. Must be one of {list(self.PROBABILITIES.keys())}")
         
         self._season = season
+        
+        # Cached arrays for batched sampling. Levels are drawn by inverting
+        # the cumulative distribution, normalised so the last bound is
+        # exactly 1.0 and every uniform in [0, 1) maps to a valid level
+        cum = np.cumsum(self.PROBABILITIES[season], dtype=np.float64)
+        self._cum = cum / cum[-1]
+        self._mins = np.array([r[0] for r in self.COVERAGE_RANGES])
+        self._maxs = np.array([r[1] for r in self.COVERAGE_RANGES])
+        
+        # Own PCG64 generator unless one is shared in, so weather is
+        # reproducible from the seed alone
+        self._rng = rng if rng is not None else np.random.default_rng(seed)
+        
+        self._buffer = []
+        self._next = 0
+    
+    def get_daily_coverage_batch(self, n_days):
+        """
+        Generate random cloud coverage for several days at once.
+        
+        Args:
+            n_days (int): Number of days to generate
+        
+        Returns:
+            numpy.ndarray: Cloud coverage factors (0-0.9), one per day
+        """
+        # 1. Selecting a cloud coverage level for every day (inverse CDF)
+        levels = np.searchsorted(self._cum, self._rng.random(n_days), side='right')
+        # 2. Obtaining the coverage range of each level
+        mins = self._mins[levels]
+        maxs = self._maxs[levels]
+        # 3. Generating random coverage within each range
+        return mins + self._rng.random(n_days) * (maxs - mins)
     
     def get_daily_coverage(self):
         """
         Generate random cloud coverage for a day based on season.
         
+        Values are drawn from a buffer that is refilled in batches by
+        get_daily_coverage_batch().
+        
         Returns:
             float: Cloud coverage factor (0-0.9)
         """
-        # 1. Obtaining the probabilities for the given season
-        probabilities = self.PROBABILITIES[self._season]
-        # 2. Selecting cloud coverage level
-        level = random.choices([0, 1, 2, 3], weights=probabilities)[0]
-        # 3. Obtaining the coverage range
-        min_coverage, max_coverage = self.COVERAGE_RANGES[level]
-        # 4. Generating random coverage within the range
-        coverage = random.uniform(min_coverage, max_coverage)
-        # 5. Returning the coverage
+        if self._next >= len(self._buffer):
+            self._buffer = self.get_daily_coverage_batch(self.BATCH_DAYS).tolist()
+            self._next = 0
+        
+        coverage = self._buffer[self._next]
+        self._next += 1
         return coverage
\ No newline at end of file
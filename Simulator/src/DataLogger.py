@@ -1,7 +1,144 @@
 import csv
-import json
-from datetime import datetime
+from contextlib import contextmanager
+from operator import itemgetter
 import os
+import re
+import time
+
+import numpy as np
+
+from .json_utils import fast_json_dump, fast_json_dumps
+
+# Optional Parquet export of the hourly data
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None
+
+# 1 MiB write buffer so each export file goes out in a few large writes
+WRITE_BUFFER = 1 << 20
+
+# EMS energy flows are kept at full precision during the simulation and
+# rounded to this many decimals only when written out
+FLOW_COLUMNS = (
+    'solar_to_load', 'solar_to_battery', 'solar_to_grid', 'battery_to_load',
+    'grid_to_load', 'unmet_load', 'curtailed',
+)
+FLOW_DECIMALS = 6
+
+# Per-battery SoC and per-inverter power columns get the same treatment
+DETAIL_COLUMN = re.compile(r'(battery_\d+_soc|inverter_\d+_(available|generated|clipped)_kw)$')
+
+
+def _rounded_columns(fieldnames):
+    """
+    Hourly columns that are rounded to FLOW_DECIMALS on export.
+    
+    Args:
+        fieldnames (iterable): Hourly column names
+    
+    Returns:
+        list: Energy flow and per-unit detail columns, in input order
+    """
+    return [name for name in fieldnames
+            if name in FLOW_COLUMNS or DETAIL_COLUMN.match(name)]
+
+
+def _row_getter(fieldnames, rounded=()):
+    """
+    Build a function returning a row dict's values as a tuple in field order.
+    
+    Used with csv.writer in place of csv.DictWriter, which re-checks every
+    row's keys against the header before writing it.
+    
+    Args:
+        fieldnames (list): Column names in output order
+        rounded (iterable): Columns to round to FLOW_DECIMALS on the way out
+    
+    Returns:
+        callable: row dict -> tuple of values
+    """
+    rounded = set(rounded)
+    rounded = [i for i, name in enumerate(fieldnames) if name in rounded]
+    if len(fieldnames) == 1:
+        field = fieldnames[0]
+        get = lambda row: (row[field],)
+    else:
+        get = itemgetter(*fieldnames)
+    
+    if not rounded:
+        return get
+    
+    def get_rounded(row):
+        values = list(get(row))
+        for i in rounded:
+            values[i] = round(values[i], FLOW_DECIMALS)
+        return values
+    
+    return get_rounded
+
+
+class _HourlyStream:
+    """
+    CSV sink for hourly records produced while a simulation runs.
+
+    Each row is written as soon as it arrives and folded into running
+    totals used by the answers document, so the hourly list never has
+    to be held in memory.
+    """
+
+    def __init__(self, f, full_level, empty_level):
+        """
+        Args:
+            f (file): Open text file to write CSV rows to
+            full_level (float): SoC (%) at or above which the battery counts as full
+            empty_level (float): SoC (%) at or below which the battery counts as empty
+        """
+        self._f = f
+        self._writer = None
+        self._getter = None
+        self.full_level = full_level
+        self.empty_level = empty_level
+        self.rows = 0
+        self.full_count = 0
+        self.empty_count = 0
+        self.cloud_sum = 0
+        self.peak_load = float('-inf')
+
+    def writerow(self, row):
+        """Write one hourly record and update the running statistics."""
+        if self._writer is None:
+            # Header comes from the first record, like the in-memory export
+            fieldnames = list(row)
+            self._getter = _row_getter(fieldnames, _rounded_columns(fieldnames))
+            self._writer = csv.writer(self._f)
+            self._writer.writerow(fieldnames)
+        self._writer.writerow(self._getter(row))
+
+        self.rows += 1
+        soc = row['battery_soc']
+        if soc >= self.full_level:
+            self.full_count += 1
+        if soc <= self.empty_level:
+            self.empty_count += 1
+        self.cloud_sum += row['cloud_coverage']
+        if row['load_demand_kw'] > self.peak_load:
+            self.peak_load = row['load_demand_kw']
+
+    def stats(self):
+        """
+        Returns:
+            dict: Row count, full/empty counts, average cloud coverage and peak load
+        """
+        return {
+            'rows': self.rows,
+            'full_count': self.full_count,
+            'empty_count': self.empty_count,
+            'avg_cloud': self.cloud_sum / self.rows if self.rows else 0.0,
+            'peak_load': self.peak_load if self.rows else 0.0,
+        }
+
 
 class DataLogger:
     """
@@ -21,16 +158,19 @@ class DataLogger:
         Initialize data logger with simulation results.
         
         Args:
-            results (dict): Simulation results from Simulation.run()
+            results (dict): Simulation results from Simulation.run(). May be None
+                when streaming with open_hourly_writer(); assign .results before save_all()
             config (dict): Configuration used for the simulation
             output_dir (str): Base directory to save output files
             use_subfolder (bool): Whether to create a subfolder for this run
         """
         self.results = results
         self.config = config
+        self._hourly_stream = None
+        self._tables = {}
         
         # Generate timestamp for folder naming
-        self.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.timestamp = time.strftime('%Y%m%d_%H%M%S')
         
         # Get key parameters for descriptive folder name
         strategy = config['energy_management']['strategy']
@@ -44,8 +184,12 @@ class DataLogger:
         else:
                 self.run_folder = output_dir
         
-        # Create the folder
-        os.makedirs(self.run_folder, exist_ok=True)
+        # Create the folder; a fresh run folder normally does not exist yet,
+        # so try the create first and only handle the rare existing case
+        try:
+            os.makedirs(self.run_folder)
+        except FileExistsError:
+            pass
         
         print(f"\nSaving to: {self.run_folder}")
     
@@ -67,6 +211,10 @@ class DataLogger:
         saved_files['daily_csv'] = self.save_daily_summaries()
         saved_files['events_csv'] = self.save_events_log()
         
+        # Optional Parquet copy of the hourly data for the ML phase
+        if self.config.get('logging', {}).get('parquet', False):
+            saved_files['hourly_parquet'] = self.save_hourly_parquet()
+        
         # Configuration (for reproducibility)
         saved_files['config_json'] = self.save_config()
         
@@ -90,21 +238,75 @@ class DataLogger:
         """
         filename = os.path.join(self.run_folder, "hourly_data.csv")
         
-        if not self.results['hourly_data']:
+        # Already written row by row during the simulation
+        if self._hourly_stream is not None:
+            print(f"  Hourly data: {self._hourly_stream.rows} rows (streamed)")
+            return filename
+        
+        rows, fieldnames = self._table('hourly_data')
+        if not rows:
             print("  Warning: No hourly data")
             return None
         
-        fieldnames = self.results['hourly_data'][0].keys()
+        self._write_csv(filename, rows, fieldnames, _rounded_columns(fieldnames))
+        
+        print(f"  Hourly data: {len(rows)} rows")
+        return filename
+    
+    def save_hourly_parquet(self):
+        """
+        Export hourly data to a snappy-compressed Parquet file (requires pyarrow).
+        
+        Enabled with "logging": {"parquet": true} in the config. Values are
+        stored at full precision. The table is built straight from the
+        simulation's column arrays when the results have them (also when
+        the CSV was streamed), otherwise from the hourly rows.
+        
+        Returns:
+            str: Path to saved file, or None if it could not be written
+        """
+        filename = os.path.join(self.run_folder, "hourly_data.parquet")
+        
+        if pa is None:
+            print("  Warning: pyarrow not installed, skipping Parquet export")
+            return None
+        
+        columns = self.results.get('hourly_columns')
+        if columns:
+            table = pa.table(columns)
+        else:
+            rows, _ = self._table('hourly_data')
+            if not rows:
+                print("  Warning: No in-memory hourly data for Parquet export")
+                return None
+            table = pa.Table.from_pylist(rows)
         
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.results['hourly_data'])
+        pa_parquet.write_table(table, filename, compression='snappy', use_dictionary=False)
         
-        rows = len(self.results['hourly_data'])
-        print(f"  Hourly data: {rows} rows")
+        print(f"  Hourly Parquet: {table.num_rows} rows")
         return filename
     
+    @contextmanager
+    def open_hourly_writer(self):
+        """
+        Open hourly_data.csv for streaming rows while the simulation runs.
+        
+        Pass the yielded writer to Simulation(hourly_writer=...). The
+        answers document then uses the writer's running totals instead
+        of results['hourly_data'].
+        
+        Yields:
+            _HourlyStream: Writer with a writerow(dict) method
+        """
+        filename = os.path.join(self.run_folder, "hourly_data.csv")
+        full_level, empty_level = self._soc_levels()
+        
+        with open(filename, 'w', newline='', buffering=WRITE_BUFFER) as f:
+            stream = _HourlyStream(f, full_level, empty_level)
+            yield stream
+        
+        self._hourly_stream = stream
+    
     def save_daily_summaries(self):
         """
         Export daily summaries to CSV.
@@ -114,19 +316,14 @@ class DataLogger:
         """
         filename = os.path.join(self.run_folder, "daily_summaries.csv")
         
-        if not self.results['daily_summaries']:
+        rows, fieldnames = self._table('daily_summaries')
+        if not rows:
             print("  Warning: No daily summaries")
             return None
         
-        fieldnames = self.results['daily_summaries'][0].keys()
-        
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.results['daily_summaries'])
+        self._write_csv(filename, rows, fieldnames)
         
-        rows = len(self.results['daily_summaries'])
-        print(f"  Daily summaries: {rows} days")
+        print(f"  Daily summaries: {len(rows)} days")
         return filename
     
     def save_events_log(self):
@@ -134,28 +331,55 @@ class DataLogger:
         Export events log to CSV.
         
         Returns:
-            str: Path to saved file
+            str: Path to saved file, or None when there were no events
         """
         filename = os.path.join(self.run_folder, "events_log.csv")
         
-        if not self.results['events_log']:
-            with open(filename, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['timestamp', 'message'])
-                writer.writeheader()
-            print(f"  Events log: 0 events")
-            return filename
-        
-        fieldnames = self.results['events_log'][0].keys()
+        # No header-only file for a run without events
+        rows, fieldnames = self._table('events_log')
+        if not rows:
+            print(f"  Events log: 0 events (no file written)")
+            return None
         
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.results['events_log'])
+        self._write_csv(filename, rows, fieldnames)
         
-        rows = len(self.results['events_log'])
-        print(f"  Events log: {rows} events")
+        print(f"  Events log: {len(rows)} events")
         return filename
     
+    def _table(self, key):
+        """
+        Rows and column names of one results table, looked up once per logger.
+        
+        Args:
+            key (str): 'hourly_data', 'daily_summaries' or 'events_log'
+        
+        Returns:
+            tuple: (list of row dicts, list of column names in first-row order)
+        """
+        cached = self._tables.get(key)
+        if cached is None:
+            rows = self.results[key]
+            cached = (rows, list(rows[0]) if rows else [])
+            self._tables[key] = cached
+        return cached
+    
+    @staticmethod
+    def _write_csv(filename, rows, fieldnames, rounded=()):
+        """
+        Write a list of row dicts to CSV in the given column order.
+        
+        Args:
+            filename (str): Destination CSV path
+            rows (list): Non-empty list of dicts sharing the same keys
+            fieldnames (list): Column names, in the order of the first row
+            rounded (list): Columns to round to FLOW_DECIMALS
+        """
+        getter = _row_getter(fieldnames, rounded)
+        with open(filename, 'w', newline='', buffering=WRITE_BUFFER) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(getter, rows))
+    
     def save_config(self):
         """
         Save configuration (including actual seed used for reproducibility).
@@ -165,8 +389,8 @@ class DataLogger:
         """
         filename = os.path.join(self.run_folder, "config.json")
         
-        with open(filename, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        with open(filename, 'wb', buffering=WRITE_BUFFER) as f:
+            f.write(fast_json_dumps(self.config))
         
         seed = self.config['simulation'].get('actual_seed_used', 'N/A')
         print(f"  Configuration saved (seed: {seed})")
@@ -189,8 +413,7 @@ class DataLogger:
             'system': self.results['system']
         }
         
-        with open(filename, 'w') as f:
-            json.dump(summary, f, indent=2)
+        fast_json_dump(summary, filename)
         
         print(f"  Summary JSON saved")
         return filename
@@ -204,14 +427,51 @@ class DataLogger:
         """
         filename = os.path.join(self.run_folder, "answers.txt")
         
-        answers_text = self._generate_answers()
+        # Encoded once and written as bytes, bypassing the text-mode wrapper
+        answers_bytes = self._generate_answers().encode('utf-8')
         
-        with open(filename, 'w') as f:
-            f.write(answers_text)
+        with open(filename, 'wb', buffering=WRITE_BUFFER) as f:
+            f.write(answers_bytes)
         
         print(f"  Answers document saved")
         return filename
     
+    def _soc_levels(self):
+        """
+        Returns:
+            tuple: (full, empty) SoC levels in % used to count full/empty steps
+        """
+        min_soc_threshold = self.config['battery']['min_soc'] * 100
+        max_soc_threshold = 100.0
+        return max_soc_threshold - 0.1, min_soc_threshold + 0.1
+    
+    def _hourly_stats(self):
+        """
+        Statistics over the hourly records used by the answers document.
+        
+        Returns:
+            dict: Row count, full/empty counts, average cloud coverage and peak load
+        """
+        if self._hourly_stream is not None:
+            return self._hourly_stream.stats()
+        
+        full_level, empty_level = self._soc_levels()
+        
+        # Per-step columns as arrays so the statistics are NumPy reductions
+        hourly, _ = self._table('hourly_data')
+        n_rows = len(hourly)
+        soc = np.fromiter((h['battery_soc'] for h in hourly), dtype=np.float64, count=n_rows)
+        cloud = np.fromiter((h['cloud_coverage'] for h in hourly), dtype=np.float64, count=n_rows)
+        load = np.fromiter((h['load_demand_kw'] for h in hourly), dtype=np.float64, count=n_rows)
+        
+        return {
+            'rows': n_rows,
+            'full_count': int(np.count_nonzero(soc >= full_level)),
+            'empty_count': int(np.count_nonzero(soc <= empty_level)),
+            'avg_cloud': float(cloud.mean()),
+            'peak_load': float(load.max()),
+        }
+    
     def _generate_answers(self):
         """
         Generate answers to all questions from the document.
@@ -219,20 +479,35 @@ class DataLogger:
         Returns:
             str: Formatted answers
         """
+        # Bind the result and config sections used throughout the report once
+        summary = self.results['summary']
+        financial = self.results['financial']
+        reliability = self.results['reliability']
+        battery = self.results['battery']
+        sim_cfg = self.config['simulation']
+        battery_cfg = self.config['battery']
+        grid_cfg = self.config['grid']
+        strategy = self.config['energy_management']['strategy']
+        
+        # Scalar constants used by several questions
+        duration_days = sim_cfg['duration_days']
+        months = duration_days / 30.0
+        inv_months = 1.0 / months if months > 0 else 1.0  # Totals -> per-month averages
+        time_step_hours = sim_cfg['time_step_minutes'] / 60.0
+        min_soc_threshold = battery_cfg['min_soc'] * 100
+        max_soc_threshold = 100.0
+        
         answers = []
         answers.append("=" * 70)
         answers.append("ANSWERS TO PROJECT QUESTIONS")
         answers.append("=" * 70)
         
-        duration_days = self.config['simulation']['duration_days']
-        months = duration_days / 30.0
-        
         # Show the actual seed used
-        actual_seed = self.config['simulation'].get('actual_seed_used', 'unknown')
+        actual_seed = sim_cfg.get('actual_seed_used', 'unknown')
         
-        answers.append(f"Simulation: {self.config['simulation']['start_date']} | "
-                      f"{self.config['simulation']['season']} | "
-                      f"{self.config['energy_management']['strategy']}")
+        answers.append(f"Simulation: {sim_cfg['start_date']} | "
+                      f"{sim_cfg['season']} | "
+                      f"{strategy}")
         answers.append(f"Duration: {duration_days} days ({months:.1f} months)")
         answers.append(f"Random Seed Used: {actual_seed}")
         answers.append("")
@@ -248,34 +523,24 @@ class DataLogger:
         
         # Question 1
         answers.append("1. What is the average state of charge of the battery over the month?")
-        answers.append(f"   -> {self.results['battery']['average_soc_percent']:.2f}%")
+        answers.append(f"   -> {battery['average_soc_percent']:.2f}%")
         answers.append("")
         
         # Question 2: Use config values
         answers.append("2. How often does the battery reach full charge or empty state?")
         
-        # Get thresholds from config
-        min_soc_threshold = self.config['battery']['min_soc'] * 100
-        max_soc_threshold = 100.0
-        
         # Count using config-based thresholds
-        full_count = sum(
-            1 for h in self.results['hourly_data'] 
-            if h['battery_soc'] >= (max_soc_threshold - 0.1)
-        )
-        empty_count = sum(
-            1 for h in self.results['hourly_data'] 
-            if h['battery_soc'] <= (min_soc_threshold + 0.1)
-        )
+        hourly_stats = self._hourly_stats()
+        full_count = hourly_stats['full_count']
+        empty_count = hourly_stats['empty_count']
 
         # Calculate hours based on time step
-        time_step_hours = self.config['simulation']['time_step_minutes'] / 60.0
-        total_steps = len(self.results['hourly_data'])
+        total_steps = hourly_stats['rows']
 
         full_hours = full_count * time_step_hours
         empty_hours = empty_count * time_step_hours
-        full_per_month = (full_hours / months) if months > 0 else full_hours
-        empty_per_month = (empty_hours / months) if months > 0 else empty_hours
+        full_per_month = full_hours * inv_months
+        empty_per_month = empty_hours * inv_months
 
         answers.append(f"   -> Full (>={max_soc_threshold - 0.1:.1f}%): {full_hours:.1f} hours total ({full_count/total_steps*100:.1f}%)")
         answers.append(f"      Per month average: {full_per_month:.1f} hours")
@@ -284,26 +549,26 @@ class DataLogger:
         
         # Question 3
         answers.append("3. What is the total energy generated by the solar panels over the month?")
-        solar_total = self.results['summary']['total_solar_generated_kwh']
-        solar_per_month = solar_total / months
+        solar_total = summary['total_solar_generated_kwh']
+        solar_per_month = solar_total * inv_months
         answers.append(f"   -> Total ({duration_days} days): {solar_total:.2f} kWh")
         answers.append(f"   -> Average per month: {solar_per_month:.2f} kWh")
         answers.append("")
         
         # Question 4
         answers.append("4. What is the total energy consumed by the household over the month?")
-        load_total = self.results['summary']['total_load_consumed_kwh']
-        load_per_month = load_total / months
+        load_total = summary['total_load_consumed_kwh']
+        load_per_month = load_total * inv_months
         answers.append(f"   -> Total ({duration_days} days): {load_total:.2f} kWh")
         answers.append(f"   -> Average per month: {load_per_month:.2f} kWh")
         answers.append("")
         
         # Question 5
         answers.append("5. How much energy is imported from/exported to the grid over the month?")
-        import_total = self.results['summary']['total_grid_imported_kwh']
-        export_total = self.results['summary']['total_grid_exported_kwh']
-        import_per_month = import_total / months
-        export_per_month = export_total / months
+        import_total = summary['total_grid_imported_kwh']
+        export_total = summary['total_grid_exported_kwh']
+        import_per_month = import_total * inv_months
+        export_per_month = export_total * inv_months
         answers.append(f"   -> Imported total: {import_total:.2f} kWh")
         answers.append(f"      Per month: {import_per_month:.2f} kWh")
         answers.append(f"   -> Exported total: {export_total:.2f} kWh")
@@ -312,35 +577,31 @@ class DataLogger:
         
         # Question 6 : Calculate downtime from hourly_data
         answers.append("6. How many times did the inverter fail, and what was the total downtime?")
-        failures = self.results['reliability']['inverter_failures']
-        
-        #Calculate actual downtime from hourly data
-        time_step_minutes = self.config['simulation']['time_step_minutes']
-        time_step_hours = time_step_minutes / 60.0
+        failures = reliability['inverter_failures']
         
-        total_downtime = self.results['reliability']['inverter_downtime_hours']
+        total_downtime = reliability['inverter_downtime_hours']
         
-        answers.append(f"   -> Failures: {failures} ({failures/months:.1f} per month)")
-        answers.append(f"   -> Total downtime: {total_downtime:.1f} hours ({total_downtime/months:.1f} hours per month)")
+        answers.append(f"   -> Failures: {failures} ({failures*inv_months:.1f} per month)")
+        answers.append(f"   -> Total downtime: {total_downtime:.1f} hours ({total_downtime*inv_months:.1f} hours per month)")
         answers.append("")
         
         # Question 7
         answers.append("7. What is the average cloud coverage during the month?")
-        avg_cloud = sum(h['cloud_coverage'] for h in self.results['hourly_data']) / len(self.results['hourly_data'])
+        avg_cloud = hourly_stats['avg_cloud']
         answers.append(f"   -> {avg_cloud:.3f} ({avg_cloud*100:.1f}%)")
         answers.append("")
         
         # Question 8
         answers.append("8. What is the peak load demand observed during the month?")
-        peak_load = max(h['load_demand_kw'] for h in self.results['hourly_data'])
+        peak_load = hourly_stats['peak_load']
         answers.append(f"   -> {peak_load:.2f} kW")
         answers.append("")
         
         # Question 9
         answers.append("9. How often was there unmet load (when demand exceeded supply)?")
-        unmet_hours = self.results['reliability']['hours_with_unmet_load']
-        unmet_pct = self.results['reliability']['unmet_load_percentage']
-        unmet_per_month = unmet_hours / months
+        unmet_hours = reliability['hours_with_unmet_load']
+        unmet_pct = reliability['unmet_load_percentage']
+        unmet_per_month = unmet_hours * inv_months
         answers.append(f"   -> {unmet_hours} hours total ({unmet_pct:.2f}%)")
         answers.append(f"   -> Per month average: {unmet_per_month:.1f} hours")
         answers.append(f"   -> Note: 'Unmet load' = energy not covered by solar+battery (imported from grid)")
@@ -348,33 +609,33 @@ class DataLogger:
         
         # Question 10
         answers.append("10. What is the efficiency of the battery system (considering round-trip losses)?")
-        answers.append(f"   -> {self.config['battery']['efficiency'] * 100}% (configured)")
+        answers.append(f"   -> {battery_cfg['efficiency'] * 100}% (configured)")
         answers.append("")
         
         # Question 11
         answers.append("11. How does the energy management strategy affect overall system performance?")
-        answers.append(f"   -> Current strategy: {self.config['energy_management']['strategy']}")
-        answers.append(f"   -> Self-sufficiency: {self.results['summary']['self_sufficiency_percent']:.2f}%")
-        answers.append(f"   -> Battery avg SoC: {self.results['battery']['average_soc_percent']:.2f}%")
-        curtailed_total = self.results['summary']['total_curtailed_kwh']
-        curtailed_per_month = curtailed_total / months
+        answers.append(f"   -> Current strategy: {strategy}")
+        answers.append(f"   -> Self-sufficiency: {summary['self_sufficiency_percent']:.2f}%")
+        answers.append(f"   -> Battery avg SoC: {battery['average_soc_percent']:.2f}%")
+        curtailed_total = summary['total_curtailed_kwh']
+        curtailed_per_month = curtailed_total * inv_months
         answers.append(f"   -> Curtailed total: {curtailed_total:.2f} kWh ({curtailed_per_month:.2f} kWh/month)")
         answers.append("   -> Note: Run 'python3 compare_strategies.py' for complete comparison")
         answers.append("")
         
         # Question 12
         answers.append("12. Which energy management strategy is most cost-effective?")
-        answers.append(f"   -> Export rate: ${self.config['grid']['export_revenue_per_kwh']}/kWh")
-        answers.append(f"   -> Import rate: ${self.config['grid']['import_cost_per_kwh']}/kWh")
-        net_cost_total = self.results['financial']['net_cost']
-        net_cost_per_month = net_cost_total / months
+        answers.append(f"   -> Export rate: ${grid_cfg['export_revenue_per_kwh']}/kWh")
+        answers.append(f"   -> Import rate: ${grid_cfg['import_cost_per_kwh']}/kWh")
+        net_cost_total = financial['net_cost']
+        net_cost_per_month = net_cost_total * inv_months
         answers.append(f"   -> Current strategy net cost: ${net_cost_total:.2f} total (${net_cost_per_month:.2f}/month)")
         answers.append("   -> Note: Run 'python3 compare_strategies.py' for complete comparison")
         answers.append("")
         
         # Question 13
         answers.append("13. What is the impact of different cloud coverage levels on solar generation?")
-        answers.append(f"   -> Season: {self.config['simulation']['season']}")
+        answers.append(f"   -> Season: {sim_cfg['season']}")
         answers.append(f"   -> Avg cloud coverage: {avg_cloud:.2f}")
         answers.append(f"   -> Solar generated: {solar_total:.2f} kWh total ({solar_per_month:.2f} kWh/month)")
         answers.append("   -> Note: Run simulations with different seasons for comparison")
@@ -382,7 +643,7 @@ class DataLogger:
         
         # Question 14
         answers.append("14. How does the system perform under different seasonal conditions?")
-        answers.append(f"   -> Current season: {self.config['simulation']['season']}")
+        answers.append(f"   -> Current season: {sim_cfg['season']}")
         answers.append(f"   -> Solar generation: {solar_total:.2f} kWh total ({solar_per_month:.2f} kWh/month)")
         answers.append("   -> Note: Run simulations with different seasons for comparison")
         answers.append("")
@@ -392,7 +653,7 @@ class DataLogger:
         if total_downtime > 0 and failures > 0:
             avg_duration = total_downtime / failures
             answers.append(f"   -> Average duration: {avg_duration:.1f} hours per failure")
-            answers.append(f"   -> Impact: {total_downtime:.1f} hours total without solar ({total_downtime/months:.1f} hours/month)")
+            answers.append(f"   -> Impact: {total_downtime:.1f} hours total without solar ({total_downtime*inv_months:.1f} hours/month)")
         else:
             answers.append(f"   -> No failures occurred during this simulation")
         answers.append("")
@@ -1,3 +1,221 @@
+import numpy as np
+
+from .numba_compat import njit
+
+# Flows are returned unrounded; anything below this is floating-point noise
+# (it would show as 0 at the 6 decimals used in exported data)
+FLOW_TOLERANCE = 5e-7
+
+# Order of the flow values returned by the strategy methods. 'unmet_load'
+# is load not covered by solar or the batteries, i.e. what had to be
+# imported; the grid has no import limit, so it always equals grid_to_load
+FLOW_NAMES = (
+    'solar_to_load', 'solar_to_battery', 'solar_to_grid', 'battery_to_load',
+    'grid_to_load', 'unmet_load', 'curtailed',
+)
+
+# Flows of a step with neither solar nor load: nothing moves
+NO_FLOWS = (0.0,) * len(FLOW_NAMES)
+
+# Integer codes for the strategies, used by the compiled run kernel
+STRATEGY_IDS = {
+    'LOAD_PRIORITY': 0,
+    'CHARGE_PRIORITY': 1,
+    'PRODUCE_PRIORITY': 2,
+}
+
+
+# ==============================BATTERY STEP KERNELS==========================================
+# Battery.charge() and Battery.discharge() carry an inline copy of this
+# arithmetic: change them together, operation for operation, or the
+# compiled run and the per-step strategies stop giving identical results.
+# These live in this module, next to the kernels that call them, because
+# numba's on-disk cache (cache=True) only checks the file defining each
+# kernel; helpers imported from another file could go stale unnoticed.
+
+@njit(cache=True)
+def _charge_step(energy, stored, capacity, one_way_eff, inv_one_way_eff):
+    """
+    Charge arithmetic of Battery.charge(), for the kernels below.
+    
+    Returns:
+        tuple: (new stored energy, energy consumed from source) in kWh
+    """
+    # Energy that can be stored after efficiency, limited by free space
+    usable = energy * one_way_eff
+    space = capacity - stored
+    to_store = usable if usable < space else space
+    # Consumed from source is the inverse operation: stored / efficiency
+    return stored + to_store, to_store * inv_one_way_eff
+
+
+@njit(cache=True)
+def _discharge_step(energy, stored, min_energy, one_way_eff, inv_one_way_eff):
+    """
+    Discharge arithmetic of Battery.discharge(), for the kernels below.
+    
+    Returns:
+        tuple: (new stored energy, energy supplied) in kWh
+    """
+    # To deliver X kWh, X/η kWh must be extracted (respecting min_soc)
+    required = energy * inv_one_way_eff
+    available = stored - min_energy
+    # Rounding can leave a battery a hair under min_soc: nothing to extract then
+    available = available if available > 0.0 else 0.0
+    extracted = required if required < available else available
+    # Energy supplied after efficiency losses
+    return stored - extracted, extracted * one_way_eff
+
+
+# ==============================BATTERY LIST KERNELS==========================================
+# The strategies for a list of Battery objects, step by step over a whole run.
+# The batteries' state is passed as arrays and updated in place; the
+# arithmetic is the same as the Python strategy methods operation for
+# operation (including the divisions by time_step_hours), so the flows and
+# battery state are identical to calling distribute_energy() every step.
+
+@njit(cache=True)
+def _list_charge(energy_kwh, stored, capacity, eff, inv_eff):
+    """
+    Kernel version of _charge_batteries() for a list of batteries.
+    
+    Returns:
+        float: Energy consumed from source in kWh
+    """
+    total_charged = 0.0
+    remaining = energy_kwh
+    for i in range(stored.shape[0]):
+        if remaining <= 0:
+            break
+        stored[i], charged = _charge_step(remaining, stored[i], capacity[i], eff[i], inv_eff[i])
+        total_charged += charged
+        remaining -= charged
+    return total_charged
+
+
+@njit(cache=True)
+def _list_discharge(energy_kwh, stored, min_energy, eff, inv_eff):
+    """
+    Kernel version of _discharge_batteries() for a list of batteries.
+    
+    Returns:
+        float: Energy supplied in kWh
+    """
+    total_discharged = 0.0
+    remaining = energy_kwh
+    for i in range(stored.shape[0]):
+        if remaining <= 0:
+            break
+        stored[i], discharged = _discharge_step(remaining, stored[i], min_energy[i], eff[i], inv_eff[i])
+        total_discharged += discharged
+        remaining -= discharged
+    return total_discharged
+
+
+@njit(cache=True)
+def _step_kernel(strategy_id, solar_kw, load_kw, stored, capacity, min_energy, eff,
+                 inv_eff, export_limit_kw, time_step_hours):
+    """
+    One step of the selected strategy (see the EnergyManagementSystem methods).
+    
+    Returns:
+        tuple: The 7 flows in FLOW_NAMES order
+    """
+    solar_to_load = 0.0
+    solar_to_battery = 0.0
+    solar_to_grid = 0.0
+    battery_to_load = 0.0
+    grid_to_load = 0.0
+    curtailed = 0.0
+    deficit = 0.0
+    
+    if solar_kw <= 0:
+        # Night or every inverter down: all strategies reduce to the deficit cascade
+        deficit = load_kw
+    elif strategy_id == 0:
+        # LOAD_PRIORITY: at most one of excess and deficit is non-zero
+        solar_to_load = solar_kw if solar_kw < load_kw else load_kw
+        excess = solar_kw - solar_to_load
+        deficit = load_kw - solar_to_load
+        if excess > 0:
+            offered_energy = excess * time_step_hours
+            charged_energy = _list_charge(offered_energy, stored, capacity, eff, inv_eff)
+            solar_to_battery = charged_energy / time_step_hours
+            excess = (offered_energy - charged_energy) / time_step_hours
+        if excess > 0:
+            solar_to_grid = excess if excess < export_limit_kw else export_limit_kw
+            if solar_to_grid < excess:
+                curtailed = excess - solar_to_grid
+    elif strategy_id == 1:
+        # CHARGE_PRIORITY
+        if solar_kw >= load_kw:
+            offered_energy = solar_kw * time_step_hours
+            charged_energy = _list_charge(offered_energy, stored, capacity, eff, inv_eff)
+            solar_to_battery = charged_energy / time_step_hours
+            solar_remaining = (offered_energy - charged_energy) / time_step_hours
+            if solar_remaining >= load_kw:
+                solar_to_load = load_kw
+                excess = solar_remaining - load_kw
+                if excess > 0:
+                    solar_to_grid = excess if excess < export_limit_kw else export_limit_kw
+                    if solar_to_grid < excess:
+                        curtailed = excess - solar_to_grid
+            else:
+                # Imported straight away, the batteries are not discharged here
+                solar_to_load = solar_remaining
+                grid_to_load = load_kw - solar_remaining
+        else:
+            solar_to_load = solar_kw
+            deficit = load_kw - solar_kw
+    else:
+        # PRODUCE_PRIORITY
+        deficit = load_kw
+        if solar_kw > 0:
+            solar_to_grid = export_limit_kw if export_limit_kw < solar_kw else solar_kw
+            solar_remaining = solar_kw - solar_to_grid
+            if solar_remaining > 0:
+                offered_energy = solar_remaining * time_step_hours
+                charged_energy = _list_charge(offered_energy, stored, capacity, eff, inv_eff)
+                solar_to_battery = charged_energy / time_step_hours
+                solar_remaining = (offered_energy - charged_energy) / time_step_hours
+            if solar_remaining > 0:
+                solar_to_load = solar_remaining if solar_remaining < load_kw else load_kw
+                deficit = load_kw - solar_to_load
+                if solar_remaining > solar_to_load:
+                    curtailed = solar_remaining - solar_to_load
+    
+    # Deficit from the batteries, then the grid
+    if deficit > 0:
+        discharged_energy = _list_discharge(deficit * time_step_hours, stored, min_energy,
+                                            eff, inv_eff)
+        battery_to_load = discharged_energy / time_step_hours
+        deficit -= battery_to_load
+    if deficit > 0:
+        grid_to_load = deficit
+    
+    return (solar_to_load, solar_to_battery, solar_to_grid, battery_to_load,
+            grid_to_load, grid_to_load, curtailed)
+
+
+@njit(cache=True)
+def _run_kernel(strategy_id, solar_kw, load_kw, stored, capacity, min_energy, eff,
+                inv_eff, export_limit_kw, time_step_hours, out, soc_out):
+    """
+    Run _step_kernel over whole solar/load series.
+    
+    Row j of `out` receives flow j of FLOW_NAMES and row b of `soc_out`
+    the SoC (%) of battery b after each step. Grid transactions are left
+    to the caller.
+    """
+    for i in range(solar_kw.shape[0]):
+        flows = _step_kernel(strategy_id, solar_kw[i], load_kw[i], stored, capacity,
+                             min_energy, eff, inv_eff, export_limit_kw, time_step_hours)
+        for j in range(7):
+            out[j, i] = flows[j]
+        for b in range(stored.shape[0]):
+            soc_out[b, i] = (stored[b] / capacity[b]) * 100
+
+
 class EnergyManagementSystem:
     """
     Manages energy distribution according to different priority strategies.
@@ -13,6 +231,10 @@ class EnergyManagementSystem:
 
     """
     
+    # Fixed attribute layout: faster attribute access on the per-step
+    # methods and a smaller footprint per EMS
+    __slots__ = ('_strategy', '_dispatch', '_strategy_id')
+    
     def __init__(self, strategy='LOAD_PRIORITY'):
         """
         Initialize the energy management system.
@@ -22,10 +244,37 @@ class EnergyManagementSystem:
                 - 'LOAD_PRIORITY': House first, battery second, grid last
                 - 'CHARGE_PRIORITY': Battery first, house second, grid last
                 - 'PRODUCE_PRIORITY': Grid export first, battery second, house last
+        
+        Raises:
+            ValueError: If the strategy is not one of the above
         """
         self._strategy = strategy
+        
+        # Resolve the strategy method once instead of comparing strings every step
+        strategies = {
+            'LOAD_PRIORITY': self._load_priority,
+            'CHARGE_PRIORITY': self._charge_priority,
+            'PRODUCE_PRIORITY': self._produce_priority,
+        }
+        if strategy not in strategies:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self._dispatch = strategies[strategy]
+        self._strategy_id = STRATEGY_IDS[strategy]
 
-    def distribute_energy(self, solar_kw, load_kw, batteries, grid, time_step_hours=1.0):
+    def resolve_strategy(self):
+        """
+        Get the method implementing the selected strategy, resolved at construction.
+        
+        For callers that run many steps: calling it directly skips the
+        distribute_energy()/distribute_step() wrapper on every step.
+        
+        Returns:
+            callable: strategy(solar_kw, load_kw, batteries, grid, time_step_hours)
+                      returning the energy flows in FLOW_NAMES order
+        """
+        return self._dispatch
+    
+    def distribute_energy(self, solar_kw, load_kw, batteries, grid, time_step_hours=1.0, out=None):
         """
         Distribute energy according to the selected strategy.
         
@@ -35,6 +284,8 @@ class EnergyManagementSystem:
             batteries (list): List of Battery objects
             grid (Grid): Grid object
             time_step_hours (float): Duration of time step in hours
+            out (dict, optional): Dict to reuse for the flows; it is updated
+                in place and returned instead of allocating a new one
             
         Returns:
             dict: Energy flows for logging {
@@ -47,18 +298,120 @@ class EnergyManagementSystem:
                 'curtailed': ...
             }
         """
-        if self._strategy == 'LOAD_PRIORITY':
-            return self._load_priority(solar_kw, load_kw, batteries, grid, time_step_hours)
-        
-        elif self._strategy == 'CHARGE_PRIORITY':
-            return self._charge_priority(solar_kw, load_kw, batteries, grid, time_step_hours)
+        if solar_kw > 0:
+            flows = self._dispatch(solar_kw, load_kw, batteries, grid, time_step_hours)
+        else:
+            flows = self.distribute_no_solar(load_kw, batteries, grid, time_step_hours)
+        if out is not None:
+            out.update(zip(FLOW_NAMES, flows))
+            return out
+        return dict(zip(FLOW_NAMES, flows))
+    
+    def distribute_step(self, solar_kw, load_kw, batteries, grid, time_step_hours, out, step):
+        """
+        Distribute energy for one step of a run, storing the flows in a preallocated array.
         
-        elif self._strategy == 'PRODUCE_PRIORITY':
-            return self._produce_priority(solar_kw, load_kw, batteries, grid, time_step_hours)
+        Same as distribute_energy() without building a dict per step.
         
+        Args:
+            solar_kw (float): Available solar power in kW
+            load_kw (float): House load demand in kW
+            batteries (list): List of Battery objects
+            grid (Grid): Grid object
+            time_step_hours (float): Duration of time step in hours
+            out (np.ndarray): Array of shape (len(FLOW_NAMES), n_steps)
+            step (int): Column of `out` to write
+            
+        Returns:
+            tuple: Energy flows in FLOW_NAMES order
+        """
+        if solar_kw > 0:
+            flows = self._dispatch(solar_kw, load_kw, batteries, grid, time_step_hours)
         else:
-            raise ValueError(f"Unknown strategy: {self._strategy}")
+            flows = self.distribute_no_solar(load_kw, batteries, grid, time_step_hours)
+        out[:, step] = flows
+        return flows
+    
+    def distribute_no_solar(self, load_kw, batteries, grid, time_step_hours):
+        """
+        Distribute energy for a step without solar (night, or every inverter down).
+        
+        With no solar there is nothing to store, export or curtail, and all
+        three strategies reduce to the same deficit cascade: batteries
+        first, then the grid. Same flows as the strategy methods with
+        solar_kw=0, without the strategy branching.
         
+        Args:
+            load_kw (float): House load demand in kW
+            batteries (list): List of Battery objects
+            grid (Grid): Grid object
+            time_step_hours (float): Duration of time step in hours
+            
+        Returns:
+            tuple: Energy flows in FLOW_NAMES order
+        """
+        # Nothing to supply: no battery or grid call needed
+        if load_kw <= 0:
+            return NO_FLOWS
+        
+        battery_to_load = 0.0
+        grid_to_load = 0.0
+        deficit = load_kw
+        
+        # Cover the load from the batteries
+        if deficit > 0:
+            discharged_energy = self._discharge_batteries(batteries, deficit * time_step_hours)
+            battery_to_load = discharged_energy / time_step_hours
+            deficit -= battery_to_load
+        
+        # Import from grid if still needed
+        if deficit > 0:
+            grid.import_energy(deficit, time_step_hours)
+            grid_to_load = deficit
+        
+        return (0.0, 0.0, 0.0, battery_to_load, grid_to_load, grid_to_load, 0.0)
+    
+    def distribute_run(self, solar_kw, load_kw, batteries, grid, time_step_hours, out, soc_out):
+        """
+        Distribute energy over a whole run with the compiled step kernel.
+        
+        Gives the same flows, battery state and grid totals as calling
+        distribute_step() once per step, with the strategy, battery and
+        grid arithmetic for every step in one compiled loop.
+        
+        Args:
+            solar_kw (np.ndarray): Available solar power at each step in kW
+            load_kw (np.ndarray): House load demand at each step in kW
+            batteries (list): List of Battery objects, updated to their final state
+            grid (Grid): Grid object
+            time_step_hours (float): Duration of time step in hours
+            out (np.ndarray): Array of shape (len(FLOW_NAMES), n_steps) for the flows
+            soc_out (np.ndarray): Array of shape (len(batteries), n_steps) for
+                the SoC (%) of each battery after each step
+        """
+        solar = np.ascontiguousarray(solar_kw, dtype=np.float64)
+        load = np.ascontiguousarray(load_kw, dtype=np.float64)
+        if solar.shape != load.shape:
+            raise ValueError("solar_kw and load_kw must have the same length")
+        
+        stored = np.array([b._energy_kwh for b in batteries], dtype=np.float64)
+        capacity = np.array([b._capacity_kwh for b in batteries], dtype=np.float64)
+        min_energy = np.array([b._min_energy_kwh for b in batteries], dtype=np.float64)
+        eff = np.array([b._one_way_efficiency for b in batteries], dtype=np.float64)
+        inv_eff = np.array([b._inv_one_way_efficiency for b in batteries], dtype=np.float64)
+        
+        _run_kernel(self._strategy_id, solar, load, stored, capacity, min_energy, eff,
+                    inv_eff, float(grid.get_export_limit()), float(time_step_hours),
+                    out, soc_out)
+        
+        for battery, energy in zip(batteries, stored.tolist()):
+            battery._energy_kwh = energy
+        
+        # Book the grid step by step, in order, like the per-step methods do
+        flows = dict(zip(FLOW_NAMES, out))
+        grid.export_series(flows['solar_to_grid'], time_step_hours)
+        grid.import_series(flows['grid_to_load'], time_step_hours)
+    
 # ==============================BSD (Battery Management System) METHODS==========================================
 
     def _charge_batteries(self, batteries, energy_kwh):
@@ -130,82 +483,64 @@ class EnergyManagementSystem:
             time_step_hours (float): Duration of time step in hours
         
         Returns:
-            dict: Energy flows
+            tuple: Energy flows in FLOW_NAMES order
         """
         # Initialize all energy flows
-        solar_to_load = 0.0
         solar_to_battery = 0.0
         solar_to_grid = 0.0
         battery_to_load = 0.0
         grid_to_load = 0.0
         curtailed = 0.0
         
-        # ========== CASE 1: Solar >= Load (excess available) ==========
-        if solar_kw >= load_kw:
-            # Step 1: Cover load with solar
-            solar_to_load = load_kw
-            excess = solar_kw - load_kw
+        # Solar covers as much of the load as it can. What is left over is
+        # either an excess (solar > load) or a deficit (solar < load), so at
+        # most one of the two cascades below does anything
+        solar_to_load = min(solar_kw, load_kw)
+        excess = solar_kw - solar_to_load
+        deficit = load_kw - solar_to_load
+        
+        # ========== EXCESS: battery first, then grid export ==========
+        if excess > 0:
+            # Offer all excess to battery
+            offered_energy = excess * time_step_hours
+            charged_energy = self._charge_batteries(batteries, offered_energy) #Update the charge method
             
-            # Step 2: Try to charge battery with excess
-            if excess > 0:
-                # Offer all excess to battery
-                offered_energy = excess * time_step_hours
-                charged_energy = self._charge_batteries(batteries, offered_energy) #Update the charge method
-                
-                # Report consumed power (what battery took from source)
-                solar_to_battery = charged_energy / time_step_hours
-                
-                # Calculate what was NOT accepted by battery
-                rejected_energy = offered_energy - charged_energy
-                remaining_power = rejected_energy / time_step_hours
-                
-                # Update excess to only what wasn't used
-                excess = remaining_power
+            # Report consumed power (what battery took from source)
+            solar_to_battery = charged_energy / time_step_hours
             
-            # Step 3: Export remaining excess to grid
-            if excess > 0:
-                exported = grid.export_energy(excess, time_step_hours)
-                solar_to_grid = exported
-                
-                # Curtail only if grid couldn't accept all
-                # (e.g., if export limit was reached)
-                if exported < excess:
-                    curtailed = excess - exported
+            # Update excess to only what battery did NOT accept
+            rejected_energy = offered_energy - charged_energy
+            excess = rejected_energy / time_step_hours
         
-        # ========== CASE 2: Solar < Load (deficit) ==========
-        else:
-            # Step 1: Use all available solar
-            solar_to_load = solar_kw
-            deficit = load_kw - solar_kw
+        if excess > 0:
+            exported = grid.export_energy(excess, time_step_hours)
+            solar_to_grid = exported
             
-            # Step 2: Try to cover deficit with battery
-            if deficit > 0:
-                requested_energy = deficit * time_step_hours
-                discharged_energy = self._discharge_batteries(batteries, requested_energy) #Update the discharge method
-                discharged_power = discharged_energy / time_step_hours
-                battery_to_load = discharged_power
-                
-                # Update deficit
-                deficit -= discharged_power
+            # Curtail only if grid couldn't accept all
+            # (e.g., if export limit was reached)
+            if exported < excess:
+                curtailed = excess - exported
+        
+        # ========== DEFICIT: battery first, then grid import ==========
+        if deficit > 0:
+            requested_energy = deficit * time_step_hours
+            discharged_energy = self._discharge_batteries(batteries, requested_energy) #Update the discharge method
+            discharged_power = discharged_energy / time_step_hours
+            battery_to_load = discharged_power
             
-            # Step 3: Import from grid if still needed
-            if deficit > 0:
-                grid.import_energy(deficit, time_step_hours)
-                grid_to_load = deficit
+            # Update deficit
+            deficit -= discharged_power
+        
+        if deficit > 0:
+            grid.import_energy(deficit, time_step_hours)
+            grid_to_load = deficit
         
         # Unmet load = energy that internal system (solar+battery) couldn't provide
         # This equals the energy we had to import from grid
         unmet_load = grid_to_load
         
-        return {
-            'solar_to_load': round(solar_to_load, 6),
-            'solar_to_battery': round(solar_to_battery, 6),
-            'solar_to_grid': round(solar_to_grid, 6),
-            'battery_to_load': round(battery_to_load, 6),
-            'grid_to_load': round(grid_to_load, 6),
-            'unmet_load': round(unmet_load, 6),
-            'curtailed': round(curtailed, 6)
-        }
+        return (solar_to_load, solar_to_battery, solar_to_grid, battery_to_load,
+                grid_to_load, unmet_load, curtailed)
         
 # ==============================CHARGE_PRIORITY==========================================
 
@@ -231,7 +566,7 @@ class EnergyManagementSystem:
             time_step_hours (float): Duration of time step in hours
             
         Returns:
-            dict: Energy flows
+            tuple: Energy flows in FLOW_NAMES order
         """    
         # Initialize flows
         solar_to_load = 0.0
@@ -296,15 +631,8 @@ class EnergyManagementSystem:
         
         unmet_load = grid_to_load
         
-        return {
-            'solar_to_load': round(solar_to_load, 6),
-            'solar_to_battery': round(solar_to_battery, 6),
-            'solar_to_grid': round(solar_to_grid, 6),
-            'battery_to_load': round(battery_to_load, 6),
-            'grid_to_load': round(grid_to_load, 6),
-            'unmet_load': round(unmet_load, 6),
-            'curtailed': round(curtailed, 6)
-        }
+        return (solar_to_load, solar_to_battery, solar_to_grid, battery_to_load,
+                grid_to_load, unmet_load, curtailed)
 
 # ==============================PRODUCE_PRIORITY==========================================
 
@@ -326,7 +654,7 @@ class EnergyManagementSystem:
             time_step_hours (float): Duration of time step in hours
             
         Returns:
-            dict: Energy flows
+            tuple: Energy flows in FLOW_NAMES order
         """
         solar_to_load = 0.0
         solar_to_battery = 0.0
@@ -335,43 +663,50 @@ class EnergyManagementSystem:
         grid_to_load = 0.0
         curtailed = 0.0
         
-        # Step 1: Export ALL solar to grid (up to limit)
-        exported = grid.export_energy(solar_kw, time_step_hours)
-        solar_to_grid = exported
-        solar_remaining = solar_kw - exported
-        
-        # Curtail if grid limit was reached
-        if exported < solar_kw:
-            # Some solar couldn't be exported due to grid limit
-            # This solar_remaining will be used for battery/load
-            pass
-        
-        # Step 2: Charge battery with remaining solar (if any)
-        if solar_remaining > 0:
-            offered_energy = solar_remaining * time_step_hours
-            charged_energy = self._charge_batteries(batteries, offered_energy) #Update the charge method
-            solar_to_battery = charged_energy / time_step_hours
+        # Night fast path: with no solar there is nothing to export, store
+        # or curtail, so only the deficit cascade below runs
+        if solar_kw > 0:
+            # Step 1: Export ALL solar to grid (up to limit)
+            exported = grid.export_energy(solar_kw, time_step_hours)
+            solar_to_grid = exported
+            # Solar over the export limit (if any) goes to the battery, then the house
+            solar_remaining = solar_kw - exported
             
-            # Calculate what wasn't used
-            rejected_energy = offered_energy - charged_energy
-            solar_remaining = rejected_energy / time_step_hours
-        
-        # Step 3: Power house with remaining solar (if any)
-        if solar_remaining > 0:
-            solar_to_load = min(solar_remaining, load_kw)
-            deficit = load_kw - solar_to_load
+            # Step 2: Charge battery with remaining solar (if any)
+            if solar_remaining > 0:
+                offered_energy = solar_remaining * time_step_hours
+                charged_energy = self._charge_batteries(batteries, offered_energy) #Update the charge method
+                solar_to_battery = charged_energy / time_step_hours
+            
+                # Calculate what wasn't used
+                rejected_energy = offered_energy - charged_energy
+                solar_remaining = rejected_energy / time_step_hours
+            
+            # Step 3: Power house with remaining solar (if any)
+            if solar_remaining > 0:
+                solar_to_load = min(solar_remaining, load_kw)
+                deficit = load_kw - solar_to_load
             
-            # Curtail any final excess
-            if solar_remaining > solar_to_load:
-                curtailed = solar_remaining - solar_to_load
+                # Curtail any final excess
+                if solar_remaining > solar_to_load:
+                    curtailed = solar_remaining - solar_to_load
+            else:
+                # No solar left for house
+                deficit = load_kw
         else:
-            # No solar left for house
             deficit = load_kw
         
-        # Step 4: Cover house deficit from battery
+        # Step 4: Cover house deficit from battery (same cascade as
+        # _discharge_batteries, without the extra call)
         if deficit > 0:
-            requested_energy = deficit * time_step_hours
-            discharged_energy = self._discharge_batteries(batteries, requested_energy) #Update the discharge method
+            remaining = deficit * time_step_hours
+            discharged_energy = 0.0
+            for battery in batteries:
+                if remaining <= 0:
+                    break
+                discharged = battery.discharge(remaining)
+                discharged_energy += discharged
+                remaining -= discharged
             discharged_power = discharged_energy / time_step_hours
             battery_to_load = discharged_power
             deficit -= discharged_power
@@ -383,12 +718,5 @@ class EnergyManagementSystem:
         
         unmet_load = grid_to_load
         
-        return {
-            'solar_to_load': round(solar_to_load, 6),
-            'solar_to_battery': round(solar_to_battery, 6),
-            'solar_to_grid': round(solar_to_grid, 6),
-            'battery_to_load': round(battery_to_load, 6),
-            'grid_to_load': round(grid_to_load, 6),
-            'unmet_load': round(unmet_load, 6),
-            'curtailed': round(curtailed, 6)
-        }
\ No newline at end of file
+        return (solar_to_load, solar_to_battery, solar_to_grid, battery_to_load,
+                grid_to_load, unmet_load, curtailed)
@@ -1,8 +1,29 @@
+import numpy as np
+
+
+def _accumulate(total, values):
+    """
+    Add values to a running total one by one, in order.
+    
+    A sequential cumulative sum (rather than a pairwise sum) gives
+    exactly the same total as calling the per-step methods in a loop.
+    """
+    if values.shape[0] == 0:
+        return total
+    return float(np.add.accumulate(np.concatenate(((total,), values)))[-1])
+
+
 class Grid:
     """
     Manages energy import/export transactions with the utility grid.
     """
     
+    # Fixed attribute layout: faster attribute access on the per-step
+    # methods and a smaller footprint per grid
+    __slots__ = ('_import_cost_per_kwh', '_export_revenue_per_kwh', '_export_limit_kw',
+                 '_total_energy_imported_kwh', '_total_energy_exported_kwh',
+                 '_total_import_cost', '_total_export_revenue')
+    
     def __init__(self, import_cost_per_kwh, export_revenue_per_kwh, 
                  export_limit_kw):
         """
@@ -22,7 +43,7 @@ class Grid:
         self._total_import_cost = 0.0
         self._total_export_revenue = 0.0
     
-    def import_energy(self, power_kw, time_step_hours=1.0):
+    def import_energy(self, power_kw, time_step_hours=1.0) -> float:
         """
         Import (buy) energy from grid.
         
@@ -48,7 +69,7 @@ class Grid:
         # 5. Return cost
         return cost
     
-    def export_energy(self, power_kw, time_step_hours=1.0):
+    def export_energy(self, power_kw, time_step_hours=1.0) -> float:
         """
         Export (sell) energy to grid.
         
@@ -77,23 +98,62 @@ class Grid:
         # 6. Return actual POWER exported (for energy flow tracking)
         return actual_power_kw
     
-    def get_total_imported(self):
+    def import_series(self, power_kw, time_step_hours=1.0):
+        """
+        Import (buy) energy for a whole series of time steps in one call.
+        
+        Args:
+            power_kw (np.ndarray): Power to import at each step in kW
+            time_step_hours (float): Duration of time step in hours
+            
+        Returns:
+            np.ndarray: Cost of each import in dollars
+        """
+        energy_kwh = power_kw * time_step_hours
+        cost = energy_kwh * self._import_cost_per_kwh
+        self._total_energy_imported_kwh = _accumulate(self._total_energy_imported_kwh, energy_kwh)
+        self._total_import_cost = _accumulate(self._total_import_cost, cost)
+        return cost
+    
+    def export_series(self, power_kw, time_step_hours=1.0):
+        """
+        Export (sell) energy for a whole series of time steps in one call.
+        
+        Args:
+            power_kw (np.ndarray): Power to export at each step in kW
+            time_step_hours (float): Duration of time step in hours
+            
+        Returns:
+            np.ndarray: Actual power exported at each step in kW
+        """
+        actual_power_kw = np.minimum(power_kw, self._export_limit_kw)
+        energy_kwh = actual_power_kw * time_step_hours
+        revenue = energy_kwh * self._export_revenue_per_kwh
+        self._total_energy_exported_kwh = _accumulate(self._total_energy_exported_kwh, energy_kwh)
+        self._total_export_revenue = _accumulate(self._total_export_revenue, revenue)
+        return actual_power_kw
+    
+    def get_export_limit(self) -> float:
+        """Get maximum export power in kW."""
+        return self._export_limit_kw
+    
+    def get_total_imported(self) -> float:
         """Get total energy imported in kWh."""
         return self._total_energy_imported_kwh
     
-    def get_total_exported(self):
+    def get_total_exported(self) -> float:
         """Get total energy exported in kWh."""
         return self._total_energy_exported_kwh
     
-    def get_total_cost(self):
+    def get_total_cost(self) -> float:
         """Get total cost of imported energy in dollars."""
         return self._total_import_cost
     
-    def get_total_revenue(self):
+    def get_total_revenue(self) -> float:
         """Get total revenue from exported energy in dollars."""
         return self._total_export_revenue
     
-    def get_net_balance(self):
+    def get_net_balance(self) -> float:
         """
         Get net financial balance.
         
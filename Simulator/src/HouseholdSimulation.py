@@ -10,13 +10,14 @@ Fix:
 
 """
 
-import json
 import os
 import random
+from itertools import accumulate
 from datetime import datetime
 
 from .Simulation import Simulation
 from .DataLogger import DataLogger
+from .json_utils import fast_json_dump, fast_json_load
 
 class HouseholdSimulation:
     """
@@ -32,8 +33,7 @@ class HouseholdSimulation:
             config_path (str): Path to neighborhood configuration JSON file
         """
         #Load configuration
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = fast_json_load(config_path)
         
         self.base_dir = os.path.dirname(os.path.abspath(config_path))
         from datetime import datetime
@@ -108,15 +108,16 @@ class HouseholdSimulation:
         total = cfg['total_households']
 
         types = list(cfg['type_distribution'].keys())
-        t_probs = list(cfg['type_distribution'].values())
         wealths = list(cfg['wealth_distribution'].keys())
-        w_probs = list(cfg['wealth_distribution'].values())
+        # Cumulative weights are built once instead of on every choices() call
+        t_cum = list(accumulate(cfg['type_distribution'].values()))
+        w_cum = list(accumulate(cfg['wealth_distribution'].values()))
 
         households = []
 
         for i in range(total):
-            htype  = random.choices(types, weights=t_probs)[0]
-            wealth = random.choices(wealths, weights=w_probs)[0]
+            htype  = random.choices(types, cum_weights=t_cum)[0]
+            wealth = random.choices(wealths, cum_weights=w_cum)[0]
             system = self._get_template(htype, wealth)
             households.append({
                 'id': f'house_{i+1:02d}',
@@ -191,9 +192,14 @@ class HouseholdSimulation:
             # Build per-household config from neighborhood_config
             household_config = self._build_household_config(household, idx)
 
-            # Run simulation in silent mode
-            sim = Simulation(config_path=household_config, verbose=False)
-            results = sim.run()
+            # Run simulation in silent mode, streaming hourly rows straight to
+            # the household's CSV so they are not kept for every household
+            house_dir = os.path.join(self.output_dir, hid)
+            logger = DataLogger(None, household_config, output_dir=house_dir, use_subfolder=False)
+            with logger.open_hourly_writer() as hourly_writer:
+                sim = Simulation(config_path=household_config, verbose=False,
+                                 hourly_writer=hourly_writer)
+                results = sim.run()
 
             # Attach household metadata to results
             results['household'] = {
@@ -207,8 +213,7 @@ class HouseholdSimulation:
             results['household'].update(sim.load.get_profile_info())
 
             # Save per-household files
-            house_dir = os.path.join(self.output_dir, hid)
-            logger = DataLogger(results, household_config, output_dir=house_dir, use_subfolder=False)
+            logger.results = results
             logger.save_all()
 
             all_results.append(results)
@@ -311,7 +316,6 @@ class HouseholdSimulation:
             })
 
         path = os.path.join(self.output_dir, 'neighborhood_summary.json')
-        with open(path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        fast_json_dump(summary, path)
 
         print(f"\n  Summary saved to: {path}")
\ No newline at end of file
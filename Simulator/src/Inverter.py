@@ -1,11 +1,11 @@
-import random
+import numpy as np
 
 class Inverter:
     """
     Simulates solar inverter with power clipping and random failures.
 
     FIX: Refactor version (changes):
-    - Failure is now modeled as a Simpy process
+    - Failures are drawn for the whole run up front by failure_schedule()
     - Uses exponential distribution
     - Models a single failure probability at a specific point in time
     - We replace the ckech_failure() and update()
@@ -13,8 +13,16 @@ class Inverter:
 
     """
     
+    # Fixed attribute layout: faster attribute access on the per-step
+    # methods and a smaller footprint per inverter
+    __slots__ = ('_max_output_kw', '_avr_days_in_failure', '_min_failure_duration',
+                 '_max_failure_duration', '_is_failing', 'total_failures',
+                 '_total_downtime_hours', 'current_failure_duration', 'panels_connected',
+                 '_rng')
+    
     def __init__(self, max_output_kw, avr_days_in_failure = 200, 
-                 min_failure_duration=4, max_failure_duration=72, panels_connected=1):
+                 min_failure_duration=4, max_failure_duration=72, panels_connected=1,
+                 rng=None):
         """
         Initialize inverter.
         
@@ -24,6 +32,8 @@ class Inverter:
             min_failure_duration (int): Minimum failure duration in hours
             max_failure_duration (int): Maximum failure duration in hours
             panels_connected (int): Number of solar panels connected to this inverter
+            rng (np.random.Generator): Source of randomness for failures
+                (default: a fresh default_rng(), not reproducible)
         """
         self._max_output_kw = max_output_kw
         self._avr_days_in_failure = avr_days_in_failure
@@ -35,8 +45,9 @@ class Inverter:
         self._total_downtime_hours = 0.0
         self.current_failure_duration = 0.0
         self.panels_connected = panels_connected
+        self._rng = rng if rng is not None else np.random.default_rng()
     
-    def apply_limit(self, solar_generation):
+    def apply_limit(self, solar_generation) -> float:
         """
         Apply inverter clipping and failure effect.
         
@@ -53,60 +64,82 @@ class Inverter:
             #If not, output is min(solar_generation, max_output_kw)
             return min(solar_generation, self._max_output_kw)
     
-    def is_operational(self):
-        """Check if inverter is working."""
-        #If it is failing, return False
-        if self._is_failing:
-            return False
-        else:
-            #If it is not failing, return True
-            return True
+    @staticmethod
+    def failing_series(hours, schedule):
+        """
+        Find the steps that fall inside a failure.
         
-    def failure_process(self, env):
+        Args:
+            hours (np.ndarray): Simulation time of each step in hours
+            schedule (np.ndarray): Failure intervals from failure_schedule()
+            
+        Returns:
+            np.ndarray: True where the inverter is failing
         """
-        Simpy process that models inverter failures over time.
-
-        In this iteration we calculate once the probability at the start (and after each recovery)
-
+        hours = np.asarray(hours)
+        if schedule.shape[0] == 0:
+            return np.zeros(hours.shape, dtype=bool)
+        
+        # Latest failure starting at or before each step, and whether it is still running
+        latest = np.searchsorted(schedule[:, 0], hours, side='right') - 1
+        return (latest >= 0) & (hours < schedule[np.maximum(latest, 0), 1])
+    
+    def failure_schedule(self, horizon_hours):
+        """
+        Draw all failures over a horizon up front.
+        
         Process:
-        1.- Generate a random time from exponetial distribution
-        2.- Sleep until that time arrives
-        3.- Change state _is_failing to True
-        4.- Generate a random failure duration between min and max
-        5.- Sleep until failure duration is over
-        6.- Change state _is_failing to False
-        7.- Repeat from step 1
-
+        1.- Generate a random time until the next failure from an exponential distribution
+        2.- Generate a random failure duration between min and max
+        3.- Repeat from step 1 after the inverter recovers, until the horizon
+        
         We choose exponential distribution because it is commonly used to model time between failures in reliability engineering.
-
-        Args: 
-            env(simpy.Environment): Simpy simulation environment
-
-        Yields:
-            simpy.events.Timeout: Timeouts for failure occurrence and recovery
         
+        Args:
+            horizon_hours (float): Length of the simulation in hours
+        
+        Returns:
+            np.ndarray: (n_failures, 2) array of [start, end) hours, in order
         """
+        avr_hours_in_failure = self._avr_days_in_failure * 24
+        intervals = []
+        t = 0.0
         while True:
-            #Step 1: Calculate when the next failure will occur
-            avr_hours_in_failure = self._avr_days_in_failure *24 #Convert days to hours
-            hours_until_failure = random.expovariate(1/avr_hours_in_failure)
-
-            #Step 2: Sleep until failure occurs
-            yield env.timeout(hours_until_failure*60) #Convert hours to minutes for env.timeout
-
-            #Step 3: Inverter fails
-            self._is_failing = True
-            self.total_failures += 1
-
-            #Step 4: Calculate failure duration
-            failure_duration = random.uniform(
+            t += self._rng.exponential(avr_hours_in_failure)
+            if t >= horizon_hours:
+                break
+            failure_duration = self._rng.uniform(
                 self._min_failure_duration, self._max_failure_duration
             )
-            self.current_failure_duration = failure_duration
-
-            #Step 5: Sleep until failure is resolved
-            yield env.timeout(failure_duration*60) #Convert hours to minutes for env.timeout
-
-            #Step 6: Inverter recovers
-            self._is_failing = False
-            self._total_downtime_hours += failure_duration
+            intervals.append((t, t + failure_duration))
+            t += failure_duration
+        return np.array(intervals, dtype=np.float64).reshape(-1, 2)
+    
+    def record_failures(self, schedule, horizon_hours):
+        """
+        Update the failure counters from a schedule drawn by failure_schedule().
+        
+        Leaves the inverter as it would be at the end of the horizon.
+        
+        Args:
+            schedule (np.ndarray): Failure intervals from failure_schedule()
+            horizon_hours (float): Length of the simulation in hours
+        """
+        starts = schedule[:, 0]
+        ends = schedule[:, 1]
+        recovered = ends < horizon_hours
+        
+        self.total_failures = int(np.count_nonzero(starts < horizon_hours))
+        self._total_downtime_hours = float((ends[recovered] - starts[recovered]).sum())
+        self._is_failing = self.total_failures > int(np.count_nonzero(recovered))
+        if schedule.shape[0]:
+            self.current_failure_duration = float(ends[-1] - starts[-1])
+    
+    def is_operational(self) -> bool:
+        """Check if inverter is working."""
+        #If it is failing, return False
+        if self._is_failing:
+            return False
+        else:
+            #If it is not failing, return True
+            return True
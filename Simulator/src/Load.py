@@ -1,4 +1,4 @@
-import random
+import numpy as np
 
 #Househol profiles based on PDF
 HOUSEHOLD_PROFILES ={
@@ -47,8 +47,17 @@ class Load:
 
     """
     
+    # Fixed attribute layout: faster attribute access in generate() and a
+    # smaller footprint per load
+    __slots__ = ('_base_load_kw', '_peak_hours_max_kw', '_household_type', '_wealth_level',
+                 '_wealth_multiplier', '_daily_avg_kwh', '_annual_kwh_min', '_annual_kwh_max',
+                 '_persons_typical', '_peak_hours_start', '_peak_hours_end', '_rng',
+                 '_scheduled_events', '_evt_hour', '_evt_prob', '_evt_min',
+                 '_evt_max', '_hour_table', '_hour_lut')
+    
     def __init__(self, base_load_kw = None, peak_hours_max_kw = None, 
-                 peak_hours_start = 18, peak_hours_end = 21, household_type = None,wealth_level = None):
+                 peak_hours_start = 18, peak_hours_end = 21, household_type = None,wealth_level = None,
+                 rng = None):
         """
         Initialize load profile.
 
@@ -62,6 +71,8 @@ class Load:
             peak_hours_end (int): End hour of peak (e.g., 21 for 9 PM)
             household_type (str): 'studio_1_bed', 'small_family', 'large_family'
             wealth_level (str): 'low', 'middle', 'high', 'luxury'
+            rng (np.random.Generator): Source of randomness for the demand draws
+                (default: a fresh default_rng(), not reproducible)
         """
         #Configure load parameters based on household type and wealth level, or use custom values if provided
         if household_type is not None:
@@ -104,6 +115,7 @@ class Load:
 
         self._peak_hours_start = peak_hours_start
         self._peak_hours_end = peak_hours_end
+        self._rng = rng if rng is not None else np.random.default_rng()
 
         # Scheduled events: (hour, probability, min_kw, max_kw)
         # Custom multipliers added
@@ -115,8 +127,28 @@ class Load:
             (12, 0.6, 1.0*m, 1.5*m),  # Lunch
             (22, 0.3, 0.5*m, 1.0*m),  # Late night snack/activity
         ]
+        
+        # Same events as parallel arrays (one entry per event)
+        self._evt_hour = np.array([event[0] for event in self._scheduled_events])
+        self._evt_prob, self._evt_min, self._evt_max = np.array(
+            [event[1:] for event in self._scheduled_events], dtype=np.float64).T
+        
+        # Hour-of-day table: (is_peak, event_probability, event_min_kw,
+        # event_max_kw) per hour; events do not apply during peak hours
+        hours = np.arange(24)
+        self._hour_table = np.zeros((24, 4))
+        self._hour_table[:, 0] = (hours >= peak_hours_start) & (hours < peak_hours_end)
+        off_peak = self._hour_table[self._evt_hour, 0] == 0
+        self._hour_table[self._evt_hour[off_peak], 1:] = np.column_stack(
+            (self._evt_prob, self._evt_min, self._evt_max))[off_peak]
+        self._hour_table.flags.writeable = False
+        
+        # Python copy of the table for generate(), so each call does one
+        # index instead of a range check and a scan of the events. Indexing
+        # the NumPy table per call would be slower and return NumPy scalars
+        self._hour_lut = tuple(map(tuple, self._hour_table.tolist()))
     
-    def generate(self, hour):
+    def generate(self, hour) -> float:
         """
         Calculate energy demand for given hour.
         
@@ -126,29 +158,66 @@ class Load:
         Returns:
             float: Total load demand in kW
         """
-        hour_of_day = int(hour)  # Convert to integer for comparisons
+        is_peak, probability, min_kw, max_kw = self._hour_lut[int(hour) % 24]
+        rng = self._rng
         
         # Component 1: Base load (always present)
         total_demand = self._base_load_kw
 
         # Component 2: Peak hours (evening activities)
-        if self._peak_hours_start <= hour_of_day < self._peak_hours_end:
+        if is_peak:
             # High consumption during evening (cooking, entertainment, etc.)
-            total_demand += random.uniform(1.0*self._wealth_multiplier, self._peak_hours_max_kw)
+            total_demand += rng.uniform(1.0*self._wealth_multiplier, self._peak_hours_max_kw)
 
-        else:
-            # Component 3: Scheduled events (outside peak hours)
-            for event_hour, probability, min_kw, max_kw in self._scheduled_events:
-                if hour_of_day == event_hour:
-                    if random.random() < probability:
-                        total_demand += random.uniform(min_kw, max_kw)
+        # Component 3: Scheduled events (outside peak hours)
+        elif probability and rng.random() < probability:
+            total_demand += rng.uniform(min_kw, max_kw)
 
         # Component 4: Random noise (always possible, anywhere)
-        if random.random() < 0.3:  # 30% chance
-            total_demand += random.uniform(0.0, 0.8*self._wealth_multiplier)
+        if rng.random() < 0.3:  # 30% chance
+            total_demand += rng.uniform(0.0, 0.8*self._wealth_multiplier)
 
         return total_demand
     
+    def generate_series(self, hours, rng=None):
+        """
+        Calculate energy demand for many hours at once.
+        
+        Same model as generate(), with every random draw made in one batch
+        by a NumPy generator instead of once per call.
+        
+        Args:
+            hours (array-like): Hours (fractional allowed; taken modulo 24)
+            rng (np.random.Generator): Source of randomness (default: this load's generator)
+            
+        Returns:
+            np.ndarray: Total load demand in kW for each hour
+        """
+        if rng is None:
+            rng = self._rng
+        
+        hour_of_day = np.asarray(hours).astype(int) % 24
+        n = hour_of_day.shape[0]
+        m = self._wealth_multiplier
+        
+        # Component 1: Base load (always present)
+        total_demand = np.full(n, float(self._base_load_kw))
+        
+        is_peak, probability, min_kw, max_kw = self._hour_table[hour_of_day].T
+        
+        # Component 2: Peak hours (evening activities)
+        total_demand += np.where(is_peak > 0, rng.uniform(1.0*m, self._peak_hours_max_kw, n), 0.0)
+        
+        # Component 3: Scheduled events (outside peak hours; probability is 0 elsewhere)
+        happens = rng.random(n) < probability
+        total_demand += np.where(happens, rng.uniform(min_kw, max_kw), 0.0)
+        
+        # Component 4: Random noise (30% chance, anywhere)
+        noise = rng.random(n) < 0.3
+        total_demand += np.where(noise, rng.uniform(0.0, 0.8*m, n), 0.0)
+        
+        return total_demand
+    
     #New get_profile_info() for metadata filtering
     def get_profile_info(self):
         """
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class SimConfig:
+    """
+    Immutable, flattened view of a simulation configuration.
+
+    Built once from the nested config dict so that timestep-invariant
+    values (totals, step counts, unit conversions) are computed a single
+    time and read as plain attributes instead of nested dict lookups.
+    """
+
+    __slots__ = (
+        'duration_days', 'time_step_minutes', 'time_step_hours', 'total_steps',
+        'steps_per_day', 'start_date', 'season', 'strategy',
+        'battery_count', 'battery_unit_kwh', 'battery_capacity_kwh',
+        'solar_count', 'solar_unit_kw', 'solar_peak_kw',
+        'inverter_count', 'inverter_unit_kw', 'inverter_max_kw',
+        'battery_efficiency', 'battery_min_soc',
+        'avr_days_in_failure', 'min_failure_duration_hours', 'max_failure_duration_hours',
+        'import_cost_per_kwh', 'export_revenue_per_kwh', 'export_limit_kw',
+    )
+
+    duration_days: int
+    time_step_minutes: int
+    time_step_hours: float
+    total_steps: int
+    steps_per_day: int
+    start_date: str
+    season: str
+    strategy: str
+    battery_count: int
+    battery_unit_kwh: float
+    battery_capacity_kwh: float
+    solar_count: int
+    solar_unit_kw: float
+    solar_peak_kw: float
+    inverter_count: int
+    inverter_unit_kw: float
+    inverter_max_kw: float
+    battery_efficiency: float
+    battery_min_soc: float
+    avr_days_in_failure: float
+    min_failure_duration_hours: float
+    max_failure_duration_hours: float
+    import_cost_per_kwh: float
+    export_revenue_per_kwh: float
+    export_limit_kw: float
+
+    @classmethod
+    def from_dict(cls, config):
+        """
+        Build a SimConfig from a loaded configuration dict.
+
+        Args:
+            config (dict): Configuration as loaded from config.json
+
+        Returns:
+            SimConfig: Frozen configuration with derived values precomputed
+        """
+        sim = config['simulation']
+        duration_days = sim['duration_days']
+        time_step_minutes = sim['time_step_minutes']
+
+        # Read unit values not totals
+        battery_count = config['battery'].get('count', 1)
+        battery_unit = config['battery']['unit_capacity_kwh']
+        solar_count = config['solar'].get('count', 1)
+        solar_unit = config['solar']['unit_peak_power_kw']
+        inverter_count = config['inverter'].get('count', 1)
+        inverter_unit = config['inverter']['unit_max_output_kw']
+        grid = config['grid']
+
+        return cls(
+            duration_days=duration_days,
+            time_step_minutes=time_step_minutes,
+            time_step_hours=time_step_minutes / 60.0,
+            total_steps=(duration_days * 24 * 60) // time_step_minutes,
+            steps_per_day=(24 * 60) // time_step_minutes,
+            start_date=sim['start_date'],
+            season=sim['season'],
+            strategy=config['energy_management']['strategy'],
+            battery_count=battery_count,
+            battery_unit_kwh=battery_unit,
+            battery_capacity_kwh=battery_count * battery_unit,
+            solar_count=solar_count,
+            solar_unit_kw=solar_unit,
+            solar_peak_kw=solar_count * solar_unit,
+            inverter_count=inverter_count,
+            inverter_unit_kw=inverter_unit,
+            inverter_max_kw=inverter_count * inverter_unit,
+            battery_efficiency=float(config['battery']['efficiency']),
+            battery_min_soc=float(config['battery']['min_soc']),
+            avr_days_in_failure=float(config['inverter']['avr_days_in_failure']),
+            min_failure_duration_hours=float(config['inverter']['min_failure_duration_hours']),
+            max_failure_duration_hours=float(config['inverter']['max_failure_duration_hours']),
+            import_cost_per_kwh=float(grid['import_cost_per_kwh']),
+            export_revenue_per_kwh=float(grid['export_revenue_per_kwh']),
+            export_limit_kw=float(grid['export_limit_kw']),
+        )
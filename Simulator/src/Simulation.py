@@ -1,27 +1,29 @@
 """
 Simulation Module - Main orchestrator for GreenGrid digital twin
 
-This module coordinates all components and runs the discrete-event simulation.
+This module coordinates all components and runs the time-stepped simulation.
 
 Fix: Refactor version (changes):
-- Inverter failure is now a separate Simpy process
+- Inverter failures are drawn up front as a schedule (failure_schedule())
 - Replaces check_failure() and update() calls
 - Failure counter now read from inverter object
 
 Update:
-- Support for multiple inverters with their own failure processes
+- Support for multiple inverters with their own failure schedules
 - Panels are distributed automatically across inverters
 - Multiple batteries are supported with BMS
 - Inverter logging in hourly data nd events_log
 - Inverter stats in compile_results
 - Add a verbose parameter for neighborhood simulation to control print statements
 - Support for different types of configurations and loads
+- SimPy removed: the timeline has a single process, so a plain step counter drives it
 """
 
-import simpy
-import json
+import sys
 from datetime import datetime, timedelta
-import random
+from itertools import repeat
+
+import numpy as np
 
 from .Battery import Battery
 from .SolarPanel import SolarPanel
@@ -29,35 +31,80 @@ from .CloudCoverage import CloudCoverage
 from .Inverter import Inverter
 from .Load import Load
 from .Grid import Grid
-from .EnergyManagementSystem import EnergyManagementSystem
+from .EnergyManagementSystem import EnergyManagementSystem, FLOW_NAMES, FLOW_TOLERANCE
+from .numba_compat import NUMBA_AVAILABLE
+from .SimConfig import SimConfig
+from .json_utils import fast_json_load
+
+# Position of grid_to_load in the flow tuples returned by the EMS
+GRID_TO_LOAD = FLOW_NAMES.index('grid_to_load')
+
+def _format_timestamps(start_date, step_minutes, total_steps):
+    """
+    Format the timestamp of every step as 'YYYY-MM-DD HH:MM:SS'.
+    
+    The times are built as one datetime64 array and formatted by NumPy
+    in a single call, instead of a datetime and a strftime() per step.
+    
+    Args:
+        start_date (datetime): Time of the first step
+        step_minutes (int): Minutes between steps
+        total_steps (int): Number of steps
+    
+    Returns:
+        np.ndarray: One timestamp string per step
+    """
+    times = np.datetime64(start_date, 's') + np.arange(total_steps) * np.timedelta64(step_minutes, 'm')
+    return np.char.replace(np.datetime_as_string(times, unit='s'), 'T', ' ')
+
+
+def _daily_sums(values, steps_per_day):
+    """
+    Sum a per-step series day by day.
+    
+    Each day is added up in step order (a running sum, not a pairwise
+    one), the same as accumulating it one step at a time.
+    
+    Args:
+        values (np.ndarray): One value per step
+        steps_per_day (int): Number of steps in a day
+    
+    Returns:
+        list: One total per day (the last day may be partial)
+    """
+    n_days = -(-values.shape[0] // steps_per_day)
+    padded = np.zeros(n_days * steps_per_day)
+    padded[:values.shape[0]] = values
+    return np.add.accumulate(padded.reshape(n_days, steps_per_day), axis=1)[:, -1].tolist()
+
 
 class Simulation:
     """
-    Main simulation orchestrator using SimPy discrete-event simulation.
+    Main simulation orchestrator stepping through time with a fixed time step.
     
     Coordinates all system components and manages energy flow through time.
     """
     
-    def __init__(self, config_path='config.json', verbose = True):
+    def __init__(self, config_path='config.json', verbose = True, hourly_writer=None):
         """
         Initialize simulation with configuration.
         
         Args:
-            config_path (str): Path to configuration JSON file
+            config_path (str or dict): Path to configuration JSON file,
+                or an already loaded configuration dict
             verbose (bool): Whether to print detailed output during simulation
+            hourly_writer: Optional sink with a writerow(dict) method, such as
+                DataLogger.open_hourly_writer(). When given, hourly records are
+                streamed to it instead of being kept in results['hourly_data']
         """
         # Load configuration
         if isinstance(config_path, dict):
             self.config = config_path
         else:
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = fast_json_load(config_path)
 
         self.verbose = verbose
         
-        # Create SimPy environment
-        self.env = simpy.Environment()
-        
         if self.verbose:
             print("\n" + "=" * 70)
             print("GREENGRID SIMULATION - STARTING")
@@ -82,21 +129,24 @@ class Simulation:
             if self.verbose:
                 print(f"Random seed: {self.actual_seed} (from config - reproducible)")
         
-        # Set the seed
-        random.seed(self.actual_seed)
+        # One seeded generator shared by the weather, the load and the inverters
+        self.rng = np.random.default_rng(self.actual_seed)
         
         # Store the actual seed used in config for logging
         self.config['simulation']['actual_seed_used'] = self.actual_seed
         
+        # Parse once into a frozen view with derived values precomputed
+        self.sim_config = SimConfig.from_dict(self.config)
+        
         # Read unit values not totals
-        battery_count = self.config['battery'].get('count', 1)
-        battery_unit = self.config['battery']['unit_capacity_kwh']
+        battery_count = self.sim_config.battery_count
+        battery_unit = self.sim_config.battery_unit_kwh
         
-        solar_count = self.config['solar'].get('count', 1)
-        solar_unit = self.config['solar']['unit_peak_power_kw']
+        solar_count = self.sim_config.solar_count
+        solar_unit = self.sim_config.solar_unit_kw
         
-        inverter_count = self.config['inverter'].get('count', 1)
-        inverter_unit = self.config['inverter']['unit_max_output_kw']
+        inverter_count = self.sim_config.inverter_count
+        inverter_unit = self.sim_config.inverter_unit_kw
 
         # Store counts for reporting
         self.battery_count = battery_count
@@ -105,16 +155,16 @@ class Simulation:
         
         if self.verbose:
             print("\nSystem Configuration:")
-            print(f"  Solar:    {solar_count} × {solar_unit} kW = {solar_count * solar_unit} kW peak")
-            print(f"  Inverter: {inverter_count} × {inverter_unit} kW = {inverter_count * inverter_unit} kW max")
-            print(f"  Battery:  {battery_count} × {battery_unit} kWh = {battery_count * battery_unit} kWh")
+            print(f"  Solar:    {solar_count} × {solar_unit} kW = {self.sim_config.solar_peak_kw} kW peak")
+            print(f"  Inverter: {inverter_count} × {inverter_unit} kW = {self.sim_config.inverter_max_kw} kW max")
+            print(f"  Battery:  {battery_count} × {battery_unit} kWh = {self.sim_config.battery_capacity_kwh} kWh")
         
         # Initialize components with capacities
         self.batteries = [
             Battery(
                 capacity_kwh = battery_unit,
-                efficiency=self.config['battery']['efficiency'],
-                min_soc = self.config['battery']['min_soc']
+                efficiency=self.sim_config.battery_efficiency,
+                min_soc = self.sim_config.battery_min_soc
             )
             for _ in range(battery_count)
         ]
@@ -124,7 +174,8 @@ class Simulation:
         )
         
         self.cloud_coverage = CloudCoverage(
-            season=self.config['simulation']['season']
+            season=self.sim_config.season,
+            rng=self.rng
         )
         
         panels_per_inverter = solar_count // inverter_count #Distribute panels across inverters
@@ -135,10 +186,11 @@ class Simulation:
             panels = panels_per_inverter + (remainder if i == inverter_count - 1 else 0) #Add remainder to the last inverter
             self.inverters.append(Inverter(
                 max_output_kw = inverter_unit,
-                avr_days_in_failure=self.config['inverter']['avr_days_in_failure'],
-                min_failure_duration=self.config['inverter']['min_failure_duration_hours'],
-                max_failure_duration=self.config['inverter']['max_failure_duration_hours'],
-                panels_connected = panels
+                avr_days_in_failure=self.sim_config.avr_days_in_failure,
+                min_failure_duration=self.sim_config.min_failure_duration_hours,
+                max_failure_duration=self.sim_config.max_failure_duration_hours,
+                panels_connected = panels,
+                rng = self.rng
 
             ))
 
@@ -152,24 +204,26 @@ class Simulation:
         if 'household_type' in load_config:
             self.load = Load(
                 household_type=load_config['household_type'],
-                wealth_level=load_config['wealth_level']
+                wealth_level=load_config['wealth_level'],
+                rng=self.rng
             )
         else:
             self.load = Load(
                 base_load_kw=load_config['base_load_kw'],
                 peak_hours_max_kw=load_config['peak_hours_max_kw'],
                 peak_hours_start=load_config['peak_hours_start'],
-                peak_hours_end=load_config['peak_hours_end']
+                peak_hours_end=load_config['peak_hours_end'],
+                rng=self.rng
             )
         
         self.grid = Grid(
-            import_cost_per_kwh=self.config['grid']['import_cost_per_kwh'],
-            export_revenue_per_kwh=self.config['grid']['export_revenue_per_kwh'],
-            export_limit_kw=self.config['grid']['export_limit_kw']
+            import_cost_per_kwh=self.sim_config.import_cost_per_kwh,
+            export_revenue_per_kwh=self.sim_config.export_revenue_per_kwh,
+            export_limit_kw=self.sim_config.export_limit_kw
         )
         
         self.ems = EnergyManagementSystem(
-            strategy=self.config['energy_management']['strategy']
+            strategy=self.sim_config.strategy
         )
 
         # ML solar predictor (Phase 3)
@@ -197,19 +251,39 @@ class Simulation:
 
         # Data collection
         self.hourly_data = []
+        self.hourly_columns = {}
+        self.hourly_writer = hourly_writer
+        
+        # Optionally keep the hourly columns as float32 (half the memory and Parquet size)
+        self.log_float32 = self.config.get('logging', {}).get('float32', False)
+        # Columns are only needed after a streamed run for the Parquet export
+        self.log_parquet = self.config.get('logging', {}).get('parquet', False)
+
+        # EMS flows stored per step in one preallocated array, a row per
+        # flow in FLOW_NAMES order; flow_data gives each row by name
+        self.flow_array = np.zeros((len(FLOW_NAMES), self.sim_config.total_steps))
+        self.flow_data = dict(zip(FLOW_NAMES, self.flow_array))
+        
+        # Battery state per step, one array per field (a row per battery);
+        # hourly records are only built from these once the run is over
+        self.battery_soc = np.zeros((battery_count, self.sim_config.total_steps))
+        self.avg_soc = np.zeros(self.sim_config.total_steps)
         self.daily_summaries = []
+        # Daily energy totals by field (one value per day), for the run totals
+        self.daily_totals = {}
         self.events_log = []
         
         # Simulation parameters
-        self.duration_days = self.config['simulation']['duration_days']
-        self.time_step_minutes = self.config['simulation']['time_step_minutes']
+        self.duration_days = self.sim_config.duration_days
+        self.time_step_minutes = self.sim_config.time_step_minutes
         self.start_date = datetime.strptime(
-            self.config['simulation']['start_date'], 
+            self.sim_config.start_date, 
             '%Y-%m-%d'
         )
         
-        # Daily cloud coverage (will be updated each day)
-        self.current_cloud_coverage = self.cloud_coverage.get_daily_coverage()
+        # Daily cloud coverage for the whole run, drawn once (a partial last day gets its own value)
+        n_days = -(-self.sim_config.total_steps // self.sim_config.steps_per_day)
+        self.daily_cloud = self.cloud_coverage.get_daily_coverage_batch(n_days)
 
     def run(self):
         """
@@ -222,21 +296,13 @@ class Simulation:
             print("-" * 70)
         
         # Calculate total steps
-        total_steps = (self.duration_days * 24 * 60) // self.time_step_minutes
+        total_steps = self.sim_config.total_steps
         if self.verbose:
             print(f"Simulating {self.duration_days * 24} hours ({self.duration_days} days)...")
             print(f"Time step: {self.time_step_minutes} min ({total_steps} total steps)")
         
-        # Register simulation process
-        self.env.process(self._simulation_loop())
-
-        # Start inverter failure processes for each inverter
-        for i, inv in enumerate(self.inverters):
-            self.env.process(inv.failure_process(self.env))
-        
-        # Run simulation
-        total_minutes = self.duration_days * 24 * 60
-        self.env.run(until=total_minutes)
+        # Run simulation (inverter failures are drawn up front by the loop)
+        self._simulation_loop()
         
         if self.verbose:
             print("-" * 70)
@@ -246,261 +312,376 @@ class Simulation:
         # Compile results
         return self._compile_results()
     
-    def _simulation_loop(self):
+    def _precompute_inputs(self):
         """
-        Main simulation loop (SimPy generator process).
+        Generate the weather, solar, inverter and load series for the whole run.
         
-        Yields:
-            simpy.Timeout: Time advancement events
-        """
-        current_step = 0
-        total_steps = (self.duration_days * 24 * 60) // self.time_step_minutes
-        time_step_hours = self.time_step_minutes / 60.0
-        
-        # Calculate steps per day for day detection
-        steps_per_day = (24 * 60) // self.time_step_minutes
-        
-        # Daily accumulators
-        daily_solar = 0
-        daily_load = 0
-        daily_grid_import = 0
-        daily_grid_export = 0
-        daily_curtailed = 0
-        current_day = 0
-
-        #Track previous states per inverter
-        inverters_were_operational = [True]*len(self.inverters)
+        None of these depend on the battery or grid state, so they are drawn
+        up front as arrays; only the energy dispatch remains step by step.
         
-        while current_step < total_steps:
-            # ========== CALCULATE CURRENT TIME (BEFORE STEP) ==========
-            minutes_since_midnight = (current_step * self.time_step_minutes) % (24 * 60)
-            hour_of_day = minutes_since_midnight / 60.0
-            
-            # Calculate current date
-            current_date = self.start_date + timedelta(
-                minutes=current_step * self.time_step_minutes
-            )
-            
-            # ========== GENERATE SOLAR POWER ==========
-            solar_available = 0.0
-            solar_generated = 0.0
-            inverter_detail = {}
-
-            # Day of year is used by the ML predictor to look up the right
-            # monthly weather profile from the Sacramento dataset.
-            day_of_year = current_date.timetuple().tm_yday
-
-            #Run through each inverter to calculate available and generated solar power, considering failures
-            for i, inv in enumerate(self.inverters):
-
-                # Phase 3: use ML model instead of math.sin when flag is set
-                if self.use_ml_solar and self.solar_predictor is not None:
-                    inv_available = self.solar_predictor.get_generation_kw(
-                        hour_of_day=hour_of_day,
-                        day_of_year=day_of_year,
-                        n_panels=inv.panels_connected,
-                        peak_power_kw=self.config['solar']['unit_peak_power_kw']
-                    )
-                else:
-                    inv_available = self.solar_panel.generate_for_panels(
-                        n_panels = inv.panels_connected,
-                        hour_of_day=hour_of_day,
-                        cloud_coverage=self.current_cloud_coverage
+        Returns:
+            dict: Per-step series:
+                'hours' (np.ndarray): Hour of day of each step
+                'cloud' (np.ndarray): Cloud coverage of each step
+                'available' (list of np.ndarray): Solar available per inverter (kW)
+                'generated' (list of np.ndarray): Inverter output per inverter (kW)
+                'operational' (list of np.ndarray): Whether each inverter is working
+                'failure_starts' (list of np.ndarray): Steps where each inverter fails
+                'failure_durations' (list of np.ndarray): Duration of those failures (hours)
+                'load' (np.ndarray): Load demand (kW)
+        """
+        total_steps = self.sim_config.total_steps
+        steps_per_day = self.sim_config.steps_per_day
+        solar_unit = self.sim_config.solar_unit_kw
+        horizon_hours = self.duration_days * 24
+        
+        # Time of each step
+        step_minutes = np.arange(total_steps) * self.time_step_minutes
+        hours = (step_minutes % (24 * 60)) / 60.0
+        elapsed_hours = step_minutes / 60.0
+        
+        # Day of each step and step within its day, laid out day by day
+        # rather than derived from the step number by division
+        n_days = self.daily_cloud.shape[0]
+        day_index = np.repeat(np.arange(n_days), steps_per_day)[:total_steps]
+        step_of_day = np.tile(np.arange(steps_per_day), n_days)[:total_steps]
+        
+        # One cloud coverage value per day, spread over that day's steps
+        cloud = self.daily_cloud[day_index]
+        
+        # Solar lookup tables. The sine model only depends on the time of
+        # day, so when every day has the same step times its clear-sky curve
+        # is computed for one day and indexed by step of day; cloud
+        # coverage then scales it
+        same_day_steps = (24 * 60) % self.time_step_minutes == 0
+        
+        # Phase 3: use ML model instead of math.sin when flag is set.
+        # Day of year is used by the ML predictor to look up the right
+        # monthly weather profile from the Sacramento dataset; its output
+        # only depends on the hour and the month, so it is called once per pair
+        if self.use_ml_solar and self.solar_predictor is not None:
+            days_of_year = [
+                (self.start_date + timedelta(days=d)).timetuple().tm_yday
+                for d in range(n_days)
+            ]
+            months = [self.solar_predictor._day_of_year_to_month(d) for d in days_of_year]
+            factor_table = {}
+            capacity_factor = np.empty(total_steps)
+            for step, (hour, day) in enumerate(zip(hours.tolist(), day_index.tolist())):
+                key = (hour, months[day])
+                factor = factor_table.get(key)
+                if factor is None:
+                    factor = factor_table[key] = self.solar_predictor.get_capacity_factor(
+                        hour_of_day=hour, day_of_year=days_of_year[day]
                     )
-                inv_generated = inv.apply_limit(inv_available)
-            
-                solar_available += inv_available
-                solar_generated += inv_generated
-
-                #Details per inverter for logging
-                inverter_detail[f'inverter_{i+1}_available_kw']= round(inv_available,6)
-                inverter_detail[f'inverter_{i+1}_generated_kw']= round(inv_generated,6)
-                inverter_detail[f'inverter_{i+1}_clipped_kw']= round(inv_available - inv_generated,6)
-                inverter_detail[f'inverter_{i+1}_panels']=inv.panels_connected
-
-                #Detect inverter failure events and log them
-                if not inv.is_operational() and inverters_were_operational[i]:
-                    duration = inv.current_failure_duration
-                    event_msg = f"Inverter {i+1} FAILURE: will last {duration:.1f} hours ({inv.panels_connected} panels affected)"
-                    if self.verbose:
-                        print(f"  [EVENT] {event_msg}")
-                    self.events_log.append({
-                        'timestamp': current_date.strftime('%Y-%m-%d %H:%M:%S'),
-                        'inverter_id': i+1,
-                        'message': event_msg
-                    })
-
-                inverters_were_operational[i] = inv.is_operational()
-
-
-            # ========== GENERATE LOAD DEMAND ==========
-            load_demand = self.load.generate(hour=hour_of_day)
-            
-            # ========== DISTRIBUTE ENERGY USING EMS ==========
-            flows = self.ems.distribute_energy(
-                solar_kw=solar_generated,
-                load_kw=load_demand,
-                batteries=self.batteries, #Update to support multiple batteries
-                grid=self.grid,
-                time_step_hours=time_step_hours
-            )
+                capacity_factor[step] = factor
+        
+        available = []
+        generated = []
+        operational = []
+        failure_starts = []
+        failure_durations = []
+        for inv in self.inverters:
+            if self.use_ml_solar and self.solar_predictor is not None:
+                inv_available = capacity_factor * inv.panels_connected * solar_unit
+            elif same_day_steps:
+                clear_sky = self.solar_panel.generate_series(
+                    inv.panels_connected, hours[:steps_per_day], 0.0
+                )
+                inv_available = clear_sky[step_of_day] * (1 - cloud)
+            else:
+                inv_available = self.solar_panel.generate_series(
+                    inv.panels_connected, hours, cloud
+                )
             
-            # ========== LOG HOURLY DATA ==========
-            # Baterry_soc logged as average across al bateries
-            avg_battery_soc = sum(b.get_soc() for b in self.batteries)/len(self.batteries)
-
-            inverter_status = {
-                f'inverter_{i+1}': inv.is_operational()
-                for i, inv in enumerate(self.inverters)
-            }
-
-            battery_detail = {
-                f'battery_{i+1}_soc': round(b.get_soc(),6)
-                for i, b in enumerate(self.batteries)
-            }
-
-            self.hourly_data.append({
-                'timestamp': current_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'step': current_step,
-                'hour': hour_of_day,
-                'solar_generated_kw': solar_generated,
-                'solar_available_kw': solar_available,
-                'load_demand_kw': load_demand,
-                'cloud_coverage': self.current_cloud_coverage,
-                'battery_soc': avg_battery_soc,
-                'solar_to_load': flows['solar_to_load'],
-                'solar_to_battery': flows['solar_to_battery'],
-                'solar_to_grid': flows['solar_to_grid'],
-                'battery_to_load': flows['battery_to_load'],
-                'grid_to_load': flows['grid_to_load'],
-                'unmet_load': flows['unmet_load'],
-                'curtailed': flows['curtailed'],
-                **inverter_detail, #Unpack individual inverter details for granular analysis
-                **inverter_status, #Unpack the information about each inverter's operational status
-                **battery_detail #Unpack the information about each battery's state of charge
-
-            })
+            # Failures are drawn for the whole run, then applied to every step
+            schedule = inv.failure_schedule(horizon_hours)
+            inv.record_failures(schedule, horizon_hours)
+            failing = inv.failing_series(elapsed_hours, schedule)
+            inv_generated = np.where(failing, 0.0, np.minimum(inv_available, inv._max_output_kw))
             
-            # ========== UPDATE DAILY TOTALS ==========
-            daily_solar += (
-                flows['solar_to_load'] + 
-                flows['solar_to_battery'] + 
-                flows['solar_to_grid']
-            ) * time_step_hours
+            # A failure is seen at the first step it covers
+            starts = np.flatnonzero(failing & ~np.concatenate(((False,), failing[:-1])))
+            latest = np.searchsorted(schedule[:, 0], elapsed_hours[starts], side='right') - 1
+            durations = schedule[latest, 1] - schedule[latest, 0]
             
-            daily_load += load_demand * time_step_hours
-            daily_grid_import += flows['grid_to_load'] * time_step_hours
-            daily_grid_export += flows['solar_to_grid'] * time_step_hours
-            daily_curtailed += flows['curtailed'] * time_step_hours
+            available.append(inv_available)
+            generated.append(inv_generated)
+            operational.append(~failing)
+            failure_starts.append(starts)
+            failure_durations.append(durations)
+        
+        return {
+            'hours': hours,
+            'cloud': cloud,
+            'available': available,
+            'generated': generated,
+            'operational': operational,
+            'failure_starts': failure_starts,
+            'failure_durations': failure_durations,
+            'load': self.load.generate_series(hours),
+        }
+    
+    def _simulation_loop(self):
+        """
+        Main simulation loop: draw the inputs, dispatch every step, then log the days.
+        """
+        total_steps = self.sim_config.total_steps
+        time_step_hours = self.sim_config.time_step_hours
+        steps_per_day = self.sim_config.steps_per_day
+        
+        # ========== SOLAR POWER AND LOAD (PRECOMPUTED) ==========
+        inputs = self._precompute_inputs()
+        solar_generated = np.sum(inputs['generated'], axis=0)
+        load_demand = inputs['load']
+        
+        # ========== DISTRIBUTE ENERGY USING EMS ==========
+        self._dispatch_energy(solar_generated, load_demand, time_step_hours)
+        
+        # Baterry_soc logged as average across al bateries
+        self.avg_soc = self.battery_soc.sum(axis=0) / len(self.batteries)
+        
+        # Inverter failure events, in time order
+        failure_events = sorted(
+            (step, i, duration)
+            for i, (starts, durations) in enumerate(zip(inputs['failure_starts'], inputs['failure_durations']))
+            for step, duration in zip(starts.tolist(), durations.tolist())
+        )
+        next_event = 0
+        
+        # ========== DAILY TOTALS ==========
+        flows = self.flow_data
+        day_starts = np.arange(0, total_steps, steps_per_day)
+        daily_solar = _daily_sums(
+            (flows['solar_to_load'] + flows['solar_to_battery'] + flows['solar_to_grid']) * time_step_hours,
+            steps_per_day)
+        daily_load = _daily_sums(load_demand * time_step_hours, steps_per_day)
+        daily_grid_import = _daily_sums(flows['grid_to_load'] * time_step_hours, steps_per_day)
+        daily_grid_export = _daily_sums(flows['solar_to_grid'] * time_step_hours, steps_per_day)
+        daily_curtailed = _daily_sums(flows['curtailed'] * time_step_hours, steps_per_day)
+        end_socs = self.battery_soc[:, np.minimum(day_starts + steps_per_day, total_steps) - 1].T.tolist()
+        self.daily_totals = {
+            'solar_generated_kwh': daily_solar,
+            'load_consumed_kwh': daily_load,
+            'grid_imported_kwh': daily_grid_import,
+            'grid_exported_kwh': daily_grid_export,
+            'curtailed_kwh': daily_curtailed,
+        }
+        
+        # Progress lines are buffered and written once per day
+        log_buffer = []
+        
+        for current_day, day_start in enumerate(day_starts.tolist()):
+            day_end = day_start + steps_per_day
             
-            # ========== ADVANCE TIME ==========
-            yield self.env.timeout(self.time_step_minutes)
-            current_step += 1
+            #Log inverter failure events of this day
+            while next_event < len(failure_events) and failure_events[next_event][0] < day_end:
+                step, i, duration = failure_events[next_event]
+                next_event += 1
+                current_date = self.start_date + timedelta(minutes=step * self.time_step_minutes)
+                event_msg = f"Inverter {i+1} FAILURE: will last {duration:.1f} hours ({self.inverters[i].panels_connected} panels affected)"
+                if self.verbose:
+                    log_buffer.append(f"  [EVENT] {event_msg}")
+                self.events_log.append({
+                    'timestamp': current_date.strftime('%Y-%m-%d %H:%M:%S'),
+                    'inverter_id': i+1,
+                    'message': event_msg
+                })
             
-            # ========== CHECK FOR NEW DAY ==========
-            if current_step % steps_per_day == 0 and current_step > 0:
-                
-                daily_self_sufficiency = (
-                    (1 - daily_grid_import / daily_load)
-                ) * 100 if daily_load > 0 else 0
-                
-                # Log daily summary
-                self._log_daily_summary(
-                    current_day,
-                    daily_solar,
-                    daily_load,
-                    daily_grid_import,
-                    daily_grid_export,
-                    daily_curtailed,
-                    daily_self_sufficiency
-                )
-                
-                # Reset daily accumulators
-                daily_solar = 0
-                daily_load = 0
-                daily_grid_import = 0
-                daily_grid_export = 0
-                daily_curtailed = 0
-                current_day += 1
-                
-                # Progress indicator
-                if current_day % 5 == 0:
-                    if self.verbose:
-                        print(f"  Day {current_day}/{self.duration_days} completed ({current_day/self.duration_days*100:.1f}%)")
-                
-                # New cloud data for next day
-                self.current_cloud_coverage = self.cloud_coverage.get_daily_coverage()
-        # Log final day if incomplete
-        if daily_solar > 0 or daily_load > 0:
             daily_self_sufficiency = (
-                (1 - daily_grid_import / daily_load)
-            ) * 100 if daily_load > 0 else 0
+                (1 - daily_grid_import[current_day] / daily_load[current_day])
+            ) * 100 if daily_load[current_day] > 0 else 0
             
+            # Log daily summary
             self._log_daily_summary(
                 current_day,
-                daily_solar,
-                daily_load,
-                daily_grid_import,
-                daily_grid_export,
-                daily_curtailed,
-                daily_self_sufficiency
+                daily_solar[current_day],
+                daily_load[current_day],
+                daily_grid_import[current_day],
+                daily_grid_export[current_day],
+                daily_curtailed[current_day],
+                daily_self_sufficiency,
+                end_socs[current_day]
             )
-
-    # ================================================================
-    #   OPTIMIZATION: EARLY EXIT FOR IDLE PERIODS
-    # ================================================================
-    def _should_fast_forward(self, solar_generated, load_demand):
+            
+            # Progress indicator
+            if (current_day + 1) % 5 == 0 and day_end <= total_steps:
+                if self.verbose:
+                    log_buffer.append(f"  Day {current_day + 1}/{self.duration_days} completed ({(current_day + 1)/self.duration_days*100:.1f}%)")
+            
+            if log_buffer:
+                sys.stdout.write('\n'.join(log_buffer) + '\n')
+                log_buffer.clear()
+        
+        # ========== LOG HOURLY DATA ==========
+        self._record_hourly_data(inputs)
+    
+    def _dispatch_energy(self, solar_generated, load_demand, time_step_hours):
         """
-        Determine whether the simulation can skip ahead safely.
-
-        Conditions for skipping:
-          - No solar generation
-          - No load demand
-          - Battery SOC unchanged (full idle)
-          - Inverter operational
-          - Grid import/export would be zero
+        Run the EMS over every step, filling flow_array and battery_soc.
+        
+        With numba available the whole run goes through the compiled
+        kernel of EnergyManagementSystem.distribute_run(); otherwise the
+        strategy methods are called step by step, with steps without solar
+        going straight to the deficit cascade, and stretches where only the
+        grid can supply the load booked at once. Both give identical flows.
+        
+        Args:
+            solar_generated (np.ndarray): Inverter output at each step in kW
+            load_demand (np.ndarray): Load demand at each step in kW
+            time_step_hours (float): Duration of time step in hours
         """
-        if solar_generated > 0:
-            return False
-        if load_demand > 0:
-            return False
-        if not self.inverter.is_operational():
-            return False
-
-        # Battery must be completely idle (neither charging nor discharging)
-        soc = self.battery.get_soc()
-        if soc not in (0, 100):
-            return False
+        if NUMBA_AVAILABLE:
+            self.ems.distribute_run(
+                solar_generated, load_demand, self.batteries, self.grid,
+                time_step_hours, self.flow_array, self.battery_soc
+            )
+            return
+        
+        # Strategy method resolved once, called directly every step
+        distribute = self.ems.resolve_strategy()
+        distribute_no_solar = self.ems.distribute_no_solar
+        batteries = self.batteries
+        grid = self.grid
+        flow_array = self.flow_array
+        battery_soc = self.battery_soc
+        solar_list = solar_generated.tolist()
+        load_list = load_demand.tolist()
+        total_steps = len(solar_list)
+        # Steps with solar, where each stretch without solar ends
+        solar_steps = np.flatnonzero(solar_generated > 0)
         
-        return True
-
-    def _fast_forward(self, current_step, steps_per_day, total_steps):
+        current_step = 0
+        while current_step < total_steps:
+            solar_kw = solar_list[current_step]
+            if solar_kw > 0:
+                flows = distribute(solar_kw, load_list[current_step], batteries, grid,
+                                   time_step_hours)
+            else:
+                # Night or every inverter down: no strategy to choose
+                flows = distribute_no_solar(load_list[current_step], batteries, grid,
+                                            time_step_hours)
+                # Once the batteries are down to their minimum, nothing changes
+                # until solar comes back: the grid covers every load, so the
+                # rest of the stretch is booked at once
+                if flows[GRID_TO_LOAD] > 0 and all(b.is_empty() for b in batteries):
+                    flow_array[:, current_step] = flows
+                    battery_soc[:, current_step] = [battery._energy_kwh for battery in batteries]
+                    current_step += 1
+                    next_solar = np.searchsorted(solar_steps, current_step)
+                    end = int(solar_steps[next_solar]) if next_solar < solar_steps.shape[0] else total_steps
+                    self._book_grid_only(load_demand[current_step:end], current_step,
+                                         time_step_hours)
+                    current_step = end
+                    continue
+            flow_array[:, current_step] = flows
+            # Stored energy read straight off each battery; SoC for the
+            # whole run is computed below, as get_soc() would
+            battery_soc[:, current_step] = [battery._energy_kwh for battery in batteries]
+            current_step += 1
+        battery_soc /= np.array([battery._capacity_kwh for battery in batteries])[:, None]
+        battery_soc *= 100
+    
+    def _book_grid_only(self, load_kw, start, time_step_hours):
         """
-        Fast-forwards safely to the next meaningful event.
+        Book a stretch of steps where the grid alone covers the load.
+        
+        Used for steps without solar while every battery is at its minimum:
+        the batteries neither charge nor discharge, so the flows and the
+        grid totals are the same as dispatching the steps one by one.
+        
+        Args:
+            load_kw (np.ndarray): Load demand over the stretch in kW
+            start (int): First step of the stretch
+            time_step_hours (float): Duration of time step in hours
         """
-        remaining = total_steps - current_step
-
-        # Upper bound: never skip more than 6 hours (common night block)
-        max_skip_steps = int((6 * 60) / self.time_step_minutes)
-
-        skip = min(steps_per_day, max_skip_steps, remaining)
-
-        # Advance simulation clock
-        self.env.timeout(skip * self.time_step_minutes)
-
-        return current_step + skip
+        end = start + load_kw.shape[0]
+        grid_to_load = np.where(load_kw > 0, load_kw, 0.0)
+        self.flow_data['grid_to_load'][start:end] = grid_to_load
+        self.flow_data['unmet_load'][start:end] = grid_to_load
+        self.battery_soc[:, start:end] = np.array([battery._energy_kwh for battery in self.batteries])[:, None]
+        self.grid.import_series(load_kw[load_kw > 0], time_step_hours)
+    
+    def _record_hourly_data(self, inputs):
+        """
+        Collect the per-step arrays into hourly columns, then hourly records.
+        
+        The columns are kept in self.hourly_columns (one array per field,
+        for columnar exports such as Parquet; float32 when "logging":
+        {"float32": true} is set). Records, one dict per step,
+        go to the streaming writer when one was given, otherwise to
+        self.hourly_data. A streamed run only keeps the columns when
+        "logging": {"parquet": true} is set, so nothing per step stays
+        in memory after the run.
+        
+        Args:
+            inputs (dict): Precomputed series from _precompute_inputs()
+        """
+        total_steps = self.sim_config.total_steps
+        
+        columns = {
+            'timestamp': _format_timestamps(self.start_date, self.time_step_minutes, total_steps),
+            'step': np.arange(total_steps),
+            'hour': inputs['hours'],
+            'solar_generated_kw': np.sum(inputs['generated'], axis=0),
+            'solar_available_kw': np.sum(inputs['available'], axis=0),
+            'load_demand_kw': inputs['load'],
+            'cloud_coverage': inputs['cloud'],
+            'battery_soc': self.avg_soc,
+        }
+        columns.update(zip(FLOW_NAMES, self.flow_array))
+        
+        #Details per inverter for granular analysis
+        for i, inv in enumerate(self.inverters):
+            inv_available = inputs['available'][i]
+            inv_generated = inputs['generated'][i]
+            columns[f'inverter_{i+1}_available_kw'] = inv_available
+            columns[f'inverter_{i+1}_generated_kw'] = inv_generated
+            columns[f'inverter_{i+1}_clipped_kw'] = inv_available - inv_generated
+            columns[f'inverter_{i+1}_panels'] = np.full(total_steps, inv.panels_connected)
+        
+        #Operational status of each inverter
+        for i, operational in enumerate(inputs['operational']):
+            columns[f'inverter_{i+1}'] = operational
+        
+        #State of charge of each battery
+        for i, soc in enumerate(self.battery_soc):
+            columns[f'battery_{i+1}_soc'] = soc
+        
+        # Rows hold plain Python values, converted once per column
+        names = tuple(columns)
+        values = [column.tolist() for column in columns.values()]
+        
+        # Results are computed in float64 either way; only the stored
+        # columns are narrowed, after the rows took their values
+        if self.log_float32:
+            columns = {
+                name: column.astype(np.float32) if column.dtype == np.float64 else column
+                for name, column in columns.items()
+            }
+        if self.hourly_writer is None or self.log_parquet:
+            self.hourly_columns = columns
+        if self.hourly_writer is not None:
+            record_hourly = self.hourly_writer.writerow
+            for row in zip(*values):
+                record_hourly(dict(zip(names, row)))
+        else:
+            # Sized once for every step, then filled in a single pass
+            hourly_data = [None] * len(values[0])
+            hourly_data[:] = map(dict, map(zip, repeat(names), zip(*values)))
+            self.hourly_data = hourly_data
 
     # ================================================================
     #   DAILY SUMMARY / RESULTS
     # ================================================================
     def _log_daily_summary(self, day, solar, load, grid_import, grid_export, 
-                          curtailed, self_sufficiency):
+                          curtailed, self_sufficiency, socs):
         batteries_soc = {
-            f'battery_{i+1}_soc': b.get_soc()
-            for i,b in enumerate(self.batteries)
+            f'battery_{i+1}_soc': soc
+            for i, soc in enumerate(socs)
         }
 
-        avg_soc = sum(b.get_soc() for b in self.batteries)/ len(self.batteries)
+        avg_soc = sum(socs)/ len(socs)
 
         self.daily_summaries.append({
             'day': day + 1,
@@ -521,19 +702,24 @@ class Simulation:
         Returns:
             dict: Complete results dictionary
         """
-        # Calculate totals
-        total_solar = sum(d['solar_generated_kwh'] for d in self.daily_summaries)
-        total_load = sum(d['load_consumed_kwh'] for d in self.daily_summaries)
-        total_import = sum(d['grid_imported_kwh'] for d in self.daily_summaries)
-        total_export = sum(d['grid_exported_kwh'] for d in self.daily_summaries)
-        total_curtailed = sum(d['curtailed_kwh'] for d in self.daily_summaries)
+        # Calculate totals from the daily columns (running sums, so the
+        # same as adding the days up one by one)
+        totals = {
+            field: float(np.add.accumulate(np.array(days))[-1]) if days else 0
+            for field, days in self.daily_totals.items()
+        }
+        total_solar = totals.get('solar_generated_kwh', 0)
+        total_load = totals.get('load_consumed_kwh', 0)
+        total_import = totals.get('grid_imported_kwh', 0)
+        total_export = totals.get('grid_exported_kwh', 0)
+        total_curtailed = totals.get('curtailed_kwh', 0)
         
         # Calculate self-sufficiency
         self_sufficiency = ((total_load - total_import) / total_load * 100) if total_load > 0 else 0
         
         # Calculate average battery SoC
-        avg_soc = sum(h['battery_soc'] for h in self.hourly_data) / len(self.hourly_data) if self.hourly_data else 0
-        final_soc = sum(b.get_soc() for b in self.batteries)/len(self.batteries)
+        avg_soc = float(self.avg_soc.mean()) if self.avg_soc.shape[0] else 0
+        final_soc = sum(map(Battery.get_soc, self.batteries))/len(self.batteries)
         
         # Count inverters failures
         per_inverter_stats = []
@@ -552,26 +738,23 @@ class Simulation:
             total_downtime += inv._total_downtime_hours
         
         # Calculate unmet load
-        time_step_hours = self.time_step_minutes / 60.0
-        total_unmet = sum(h['unmet_load'] for h in self.hourly_data) * time_step_hours
+        time_step_hours = self.sim_config.time_step_hours
+        unmet = self.flow_data['unmet_load']
+        total_unmet = float(unmet.sum()) * time_step_hours
         unmet_percentage = (total_unmet / total_load * 100) if total_load > 0 else 0
         
         # Calculate hours with unmet load
-        hours_with_unmet = sum(time_step_hours for h in self.hourly_data if h['unmet_load'] > 0)
+        hours_with_unmet = int(np.count_nonzero(unmet >= FLOW_TOLERANCE)) * time_step_hours
         
         # Get financial data from grid
         total_import_cost = self.grid.get_total_cost()
         total_export_revenue = self.grid.get_total_revenue()
         net_cost = total_import_cost - total_export_revenue
         
-        # System configuration summary
-        battery_unit = self.config['battery']['unit_capacity_kwh']
-        solar_unit = self.config['solar']['unit_peak_power_kw']
-        inverter_unit = self.config['inverter']['unit_max_output_kw']
-
         return {
             'config_used': self.config,
             'hourly_data': self.hourly_data,
+            'hourly_columns': self.hourly_columns,
             'daily_summaries': self.daily_summaries,
             'events_log': self.events_log,
             
@@ -603,11 +786,11 @@ class Simulation:
             },
             
             'system': {
-                'battery_capacity_kwh': battery_unit * self.battery_count,
+                'battery_capacity_kwh': self.sim_config.battery_capacity_kwh,
                 'battery_count': self.battery_count,
-                'solar_peak_kw': solar_unit * self.solar_count,
+                'solar_peak_kw': self.sim_config.solar_peak_kw,
                 'solar_count': self.solar_count,
-                'inverter_max_kw': inverter_unit *self.inverter_count,
+                'inverter_max_kw': self.sim_config.inverter_max_kw,
                 'inverter_count': self.inverter_count
             }
         }
\ No newline at end of file
@@ -1,5 +1,16 @@
 import math
 
+import numpy as np
+
+
+# sin(sun_angle) at each whole daylight hour, 6:00 to 17:00, computed once.
+# Whole hours (the common hourly-step case) look their value up here;
+# fractional hours fall back to math.sin
+_HOURLY_SUN_SHAPE = {
+    hour: math.sin((hour - 6) * (math.pi / 12)) for hour in range(6, 18)
+}
+
+
 class SolarPanel:
     """
     Simulates solar panel energy generation based on time and weather.
@@ -35,14 +46,15 @@ class SolarPanel:
         if hour_of_day < 6 or hour_of_day >= 18:
             return 0.0
         
-        # 2. Calculate hours_since_sunrise 
-        hours_since_sunrise = hour_of_day - 6
-        
-        # 3. Calculate sun_angle
-        sun_angle = hours_since_sunrise * (math.pi / 12)
+        # 2-3. Sun angle from hours_since_sunrise (cached for whole hours)
+        sun_shape = _HOURLY_SUN_SHAPE.get(hour_of_day)
+        if sun_shape is None:
+            hours_since_sunrise = hour_of_day - 6
+            sun_angle = hours_since_sunrise * (math.pi / 12)
+            sun_shape = math.sin(sun_angle)
         
         # 4. Calculate base_generation 
-        base_generation = self._peak_power_kw * math.sin(sun_angle)
+        base_generation = self._peak_power_kw * sun_shape
         
         # 5. Apply clouds
         actual_generation = base_generation * (1 - cloud_coverage)
@@ -68,16 +80,38 @@ class SolarPanel:
         if hour_of_day < 6 or hour_of_day >= 18:
             return 0.0
         
-        #Calculate hours since sunrise and sun angle
-        hours_since_sunrise = hour_of_day - 6
-        sun_angle =  hours_since_sunrise * (math.pi / 12)
+        #Calculate hours since sunrise and sun angle (cached for whole hours)
+        sun_shape = _HOURLY_SUN_SHAPE.get(hour_of_day)
+        if sun_shape is None:
+            hours_since_sunrise = hour_of_day - 6
+            sun_angle =  hours_since_sunrise * (math.pi / 12)
+            sun_shape = math.sin(sun_angle)
 
         #Generation for the n_panels
         subset_peak_power_kw = self._peak_power_kw * n_panels
-        base_generation = subset_peak_power_kw * math.sin(sun_angle)
+        base_generation = subset_peak_power_kw * sun_shape
         actual_generation = base_generation * (1 - cloud_coverage)
 
         return actual_generation
-
+    
+    def generate_series(self, n_panels, hours, cloud_coverage):
+        """
+        Calculate solar generation for a subset of panels over many steps at once.
         
-
+        Same model as generate_for_panels(), evaluated with NumPy.
+        
+        Args:
+            n_panels (int): Number of panels connected to an inverter
+            hours (np.ndarray): Hour of day of each step (0-24, can be fractional)
+            cloud_coverage (np.ndarray): Cloud coverage factor of each step (0-1)
+            
+        Returns:
+            np.ndarray: Generated power in kW for n_panels at each step
+        """
+        hours = np.asarray(hours, dtype=np.float64)
+        sun_angle = (hours - 6) * (math.pi / 12)
+        base_generation = (self._peak_power_kw * n_panels) * np.sin(sun_angle)
+        actual_generation = base_generation * (1 - np.asarray(cloud_coverage))
+        
+        # No sun before 6:00 or from 18:00 on
+        return np.where((hours >= 6) & (hours < 18), actual_generation, 0.0)
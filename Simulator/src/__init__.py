@@ -5,5 +5,7 @@ from .Inverter import Inverter
 from .Load import Load
 from .Grid import Grid
 from .EnergyManagementSystem import EnergyManagementSystem
+from .SimConfig import SimConfig
 from .Simulation import Simulation
-from .HouseholdSimulation import HouseholdSimulation
\ No newline at end of file
+from .HouseholdSimulation import HouseholdSimulation
+from .json_utils import fast_json_dump, fast_json_load
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+JSON helpers shared by the simulator and its command-line tools.
+
+orjson is used when it is installed; otherwise the stdlib json module
+is used, so it remains an optional dependency.
+"""
+
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def fast_json_load(path):
+    """
+    Load a JSON file by parsing it directly from a read-only memory map.
+
+    The file contents are read from the OS page cache instead of being
+    copied into an intermediate Python buffer first, which keeps memory
+    flat when loading large result files.
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        The decoded JSON document
+    """
+    with open(path, 'rb') as f:
+        # mmap cannot map an empty file; let the parser raise its usual error
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b'') if orjson is not None else json.loads(b'')
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+
+
+def _to_builtin(obj):
+    """stdlib json fallback for NumPy scalars and arrays."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def fast_json_dumps(obj):
+    """
+    Encode an object as 2-space indented JSON bytes.
+
+    Args:
+        obj: JSON-serializable object (may contain NumPy scalars/arrays)
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2
+                            | orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, default=_to_builtin).encode('utf-8')
+
+
+def fast_json_dump(obj, path):
+    """
+    Write an object to a JSON file with 2-space indentation.
+
+    With orjson the document is encoded in C (NumPy values included)
+    and written in a single call.
+
+    Args:
+        obj: JSON-serializable object (may contain NumPy scalars/arrays)
+        path (str): Destination file path
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(fast_json_dumps(obj))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, default=_to_builtin)
@@ -0,0 +1,19 @@
+"""
+Optional Numba support for the simulator's numeric kernels.
+
+When numba is installed, `njit` compiles the decorated function to
+native code. Otherwise it is a no-op decorator and the kernels run as
+plain Python, with identical results.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,79 @@
+import sys
+import os
+
+import numpy as np
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Battery import Battery
+from src.Grid import Grid
+from src.EnergyManagementSystem import EnergyManagementSystem
+from src.numba_compat import NUMBA_AVAILABLE
+
+# The compiled run kernel (distribute_run) must give exactly the same flows,
+# battery state and grid totals as the Python strategy methods step by step
+
+N_STEPS = 2000
+
+
+def make_system(n_batteries, export_limit_kw):
+    """Fresh batteries and grid, so both paths start from the same state."""
+    batteries = [Battery(capacity_kwh=13.5 - i, efficiency=0.9, min_soc=0.1)
+                 for i in range(n_batteries)]
+    grid = Grid(import_cost_per_kwh=0.15, export_revenue_per_kwh=0.05,
+                export_limit_kw=export_limit_kw)
+    return batteries, grid
+
+
+def grid_totals(grid):
+    return (grid.get_total_imported(), grid.get_total_exported(),
+            grid.get_total_cost(), grid.get_total_revenue())
+
+
+print("=" * 70)
+print("EMS RUN KERNEL vs PER-STEP STRATEGIES")
+print(f"(numba {'available' if NUMBA_AVAILABLE else 'not installed, kernel runs as Python'})")
+print("=" * 70)
+
+rng = np.random.default_rng(42)
+failures = 0
+
+for strategy in ('LOAD_PRIORITY', 'CHARGE_PRIORITY', 'PRODUCE_PRIORITY'):
+    ems = EnergyManagementSystem(strategy=strategy)
+    for n_batteries in (1, 3):
+        for time_step_hours in (1.0, 0.25):
+            for export_limit_kw in (20.0, 1.5):
+                # Nights (no solar) mixed with daylight, so every branch runs
+                solar = np.where(rng.random(N_STEPS) < 0.4, 0.0, rng.random(N_STEPS) * 6)
+                load = rng.random(N_STEPS) * 4
+
+                # Per-step Python strategies
+                batteries_py, grid_py = make_system(n_batteries, export_limit_kw)
+                flows_py = np.zeros((7, N_STEPS))
+                soc_py = np.zeros((n_batteries, N_STEPS))
+                for i in range(N_STEPS):
+                    ems.distribute_step(float(solar[i]), float(load[i]), batteries_py,
+                                        grid_py, time_step_hours, flows_py, i)
+                    soc_py[:, i] = [b.get_soc() for b in batteries_py]
+
+                # Whole run through the kernel
+                batteries_k, grid_k = make_system(n_batteries, export_limit_kw)
+                flows_k = np.zeros((7, N_STEPS))
+                soc_k = np.zeros((n_batteries, N_STEPS))
+                ems.distribute_run(solar, load, batteries_k, grid_k, time_step_hours,
+                                   flows_k, soc_k)
+
+                same = (np.array_equal(flows_py, flows_k)
+                        and np.array_equal(soc_py, soc_k)
+                        and [b.get_soc() for b in batteries_py] == [b.get_soc() for b in batteries_k]
+                        and grid_totals(grid_py) == grid_totals(grid_k))
+                label = (f"{strategy:<17} batteries={n_batteries} dt={time_step_hours}h "
+                         f"limit={export_limit_kw} kW")
+                print(f"{label}: {'OK' if same else 'MISMATCH'}")
+                if not same:
+                    failures += 1
+
+print("=" * 70)
+assert failures == 0, f"{failures} configurations differ between kernel and Python strategies"
+print("All configurations identical")